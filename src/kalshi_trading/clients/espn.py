@@ -1,6 +1,6 @@
 """ESPN API client for sports scoreboards."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
@@ -23,7 +23,7 @@ class GameStatus(str, Enum):
     POST = "post"  # Finished
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Team:
     """Team information."""
 
@@ -32,12 +32,14 @@ class Team:
     display_name: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameState:
     """
     Current state of a game.
 
     This is the primary data model passed to trading strategies.
+    Snapshots are immutable, so margin and is_live are computed once
+    at construction and read as plain slots on every strategy tick.
     """
 
     event_id: str
@@ -51,19 +53,17 @@ class GameState:
     status: GameStatus
     start_time: str = ""  # ISO format game start time
 
-    @property
-    def margin(self) -> int:
-        """
-        Point margin from home team's perspective.
+    # Point margin from home team's perspective.
+    # Positive = home leading, negative = away leading.
+    margin: int = field(init=False, compare=False)
 
-        Positive = home leading, negative = away leading.
-        """
-        return self.home_score - self.away_score
+    # Whether the game is currently in progress
+    is_live: bool = field(init=False, compare=False)
 
-    @property
-    def is_live(self) -> bool:
-        """Check if game is currently in progress."""
-        return self.status == GameStatus.IN
+    def __post_init__(self) -> None:
+        """Derive the cached margin and live flag (frozen, so bypass __setattr__)."""
+        object.__setattr__(self, "margin", self.home_score - self.away_score)
+        object.__setattr__(self, "is_live", self.status == GameStatus.IN)
 
     @property
     def is_final(self) -> bool:
@@ -99,14 +99,20 @@ class ESPNClient:
         Sport.COLLEGE_FOOTBALL: "/football/college-football",
     }
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
         """
         Initialize ESPN client.
 
         Args:
             timeout: Request timeout in seconds
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
         """
         self.timeout = timeout
+        self.transport = transport
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> "ESPNClient":
@@ -114,6 +120,7 @@ class ESPNClient:
         self._client = httpx.AsyncClient(
             base_url=self.BASE_URL,
             timeout=self.timeout,
+            transport=self.transport,
         )
         return self
 
@@ -1,13 +1,12 @@
 """Kalshi API client with RSA-PSS authentication."""
 
 import base64
+import functools
 import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding, rsa
 
 from .models import (
     Balance,
@@ -20,6 +19,20 @@ from .models import (
     PositionsResponse,
 )
 
+# cryptography is imported where keys are loaded and used, so importing the
+# package (e.g. for strategies or backtests) doesn't load the OpenSSL bindings
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+    from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+
+
+@functools.lru_cache(maxsize=8)
+def _load_pem(key_data: bytes) -> "PrivateKeyTypes":
+    """Deserialize a PEM private key, once per distinct key."""
+    from cryptography.hazmat.primitives import serialization
+
+    return serialization.load_pem_private_key(key_data, password=None)
+
 
 class KalshiAuthError(Exception):
     """Raised when authentication fails."""
@@ -69,6 +82,7 @@ class KalshiClient:
         private_key_path: Path | str,
         environment: str = "sandbox",
         timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """
         Initialize Kalshi client.
@@ -78,6 +92,7 @@ class KalshiClient:
             private_key_path: Path to RSA private key PEM file
             environment: "sandbox" or "production"
             timeout: Request timeout in seconds
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
         """
         if environment not in self.ENVIRONMENTS:
             raise ValueError(f"Invalid environment: {environment}")
@@ -85,17 +100,20 @@ class KalshiClient:
         self.api_key_id = api_key_id
         self.base_url = self.ENVIRONMENTS[environment]
         self.timeout = timeout
+        self.transport = transport
         self._client: httpx.AsyncClient | None = None
 
         # Load private key
         self._private_key = self._load_private_key(Path(private_key_path))
 
-    def _load_private_key(self, path: Path) -> rsa.RSAPrivateKey:
+    def _load_private_key(self, path: Path) -> "RSAPrivateKey":
         """Load RSA private key from PEM file."""
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
         try:
             with open(path, "rb") as f:
                 key_data = f.read()
-            private_key = serialization.load_pem_private_key(key_data, password=None)
+            private_key = _load_pem(key_data)
             if not isinstance(private_key, rsa.RSAPrivateKey):
                 raise KalshiAuthError("Key must be an RSA private key")
             return private_key
@@ -116,6 +134,9 @@ class KalshiClient:
         Returns:
             Base64-encoded signature string
         """
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
         # Message format: timestamp + method + path
         message = f"{timestamp}{method}{path}"
         message_bytes = message.encode("utf-8")
@@ -149,6 +170,7 @@ class KalshiClient:
             base_url=self.base_url,
             timeout=self.timeout,
             headers={"Content-Type": "application/json"},
+            transport=self.transport,
         )
         return self
 
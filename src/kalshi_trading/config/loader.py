@@ -1,7 +1,7 @@
 """Configuration loading and strategy factory."""
 
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import yaml
 
@@ -12,6 +12,9 @@ from kalshi_trading.strategies.scoreboard import (
     ScoreMarginStrategy,
 )
 
+# LibYAML's C parser when PyYAML was built with it, else the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigError(Exception):
     """Raised when configuration is invalid."""
@@ -27,12 +30,12 @@ STRATEGY_TYPES: dict[str, type[TradingStrategy]] = {
 }
 
 
-def load_yaml_config(path: Path) -> dict[str, Any]:
+def load_yaml_config(source: Path | IO[str]) -> dict[str, Any]:
     """
-    Load YAML configuration file.
+    Load YAML configuration from a file or an open text stream.
 
     Args:
-        path: Path to YAML file
+        source: Path to YAML file, or a readable text stream (e.g. io.StringIO)
 
     Returns:
         Parsed configuration dict
@@ -40,14 +43,14 @@ def load_yaml_config(path: Path) -> dict[str, Any]:
     Raises:
         ConfigError: If file doesn't exist or is invalid
     """
-    if not path.exists():
-        raise ConfigError(f"Config file not found: {path}")
+    if isinstance(source, Path):
+        if not source.exists():
+            raise ConfigError(f"Config file not found: {source}")
 
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise ConfigError(f"Invalid YAML in {path}: {e}")
+        with open(source, "r", encoding="utf-8") as f:
+            config = _parse_yaml(f, source)
+    else:
+        config = _parse_yaml(source, getattr(source, "name", "<stream>"))
 
     if not isinstance(config, dict):
         raise ConfigError(f"Config must be a dict, got {type(config)}")
@@ -55,6 +58,14 @@ def load_yaml_config(path: Path) -> dict[str, Any]:
     return config
 
 
+def _parse_yaml(stream: IO[str], origin: object) -> Any:
+    """Parse a YAML text stream, naming ``origin`` in any error."""
+    try:
+        return yaml.load(stream, Loader=_YamlLoader)
+    except yaml.YAMLError as e:
+        raise ConfigError(f"Invalid YAML in {origin}: {e}") from e
+
+
 def create_strategy_from_config(config: dict[str, Any]) -> TradingStrategy:
     """
     Create a strategy instance from configuration.
@@ -140,12 +151,12 @@ def _create_from_entry_conditions(config: dict[str, Any]) -> TradingStrategy:
     return composite
 
 
-def load_strategy_from_file(path: Path) -> TradingStrategy:
+def load_strategy_from_file(source: Path | IO[str]) -> TradingStrategy:
     """
-    Load a strategy from a YAML file.
+    Load a strategy from a YAML file or an open text stream.
 
     Args:
-        path: Path to strategy YAML file
+        source: Path to strategy YAML file, or a readable text stream
 
     Returns:
         Configured TradingStrategy instance
@@ -153,11 +164,12 @@ def load_strategy_from_file(path: Path) -> TradingStrategy:
     Raises:
         ConfigError: If file is invalid
     """
-    config = load_yaml_config(path)
+    config = load_yaml_config(source)
 
     # Check if strategy is enabled
     if not config.get("enabled", True):
-        raise ConfigError(f"Strategy '{config.get('name', path.stem)}' is disabled")
+        default_name = source.stem if isinstance(source, Path) else "unnamed"
+        raise ConfigError(f"Strategy '{config.get('name', default_name)}' is disabled")
 
     return create_strategy_from_config(config)
 
@@ -66,9 +66,10 @@ async def collector_loop() -> None:
     while state.collector_running:
         try:
             games = await state.espn.get_all_live_games()
+            snapshot_time = datetime.now().isoformat()
             for sport, game_list in games.items():
                 for game in game_list:
-                    state.db.insert_game_state(game)
+                    state.db.insert_game_state(game, timestamp=snapshot_time)
                     state.snapshots_collected += 1
                     
                     # Collect Kalshi prices if available
@@ -90,6 +91,7 @@ async def collector_loop() -> None:
                                         no_ask=market.no_ask,
                                         volume=market.volume,
                                         open_interest=market.open_interest,
+                                        timestamp=snapshot_time,
                                     )
                                     state.market_snapshots_collected += 1
                         except Exception:
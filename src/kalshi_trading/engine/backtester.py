@@ -16,7 +16,7 @@ from kalshi_trading.strategies.base import MarketState, Signal, TradeSignal, Tra
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestTrade:
     """Record of a simulated trade during backtesting."""
 
@@ -170,10 +170,10 @@ class Backtester:
         params: list[Any] = []
 
         if start_date:
-            query += " AND date(timestamp) >= ?"
+            query += " AND snapshot_date >= ?"
             params.append(start_date)
         if end_date:
-            query += " AND date(timestamp) <= ?"
+            query += " AND snapshot_date <= ?"
             params.append(end_date)
         if sport:
             query += " AND sport = ?"
@@ -209,7 +209,23 @@ class Backtester:
         # Track if we've already signaled for this event per strategy
         signaled: set[str] = set()
 
-        for snapshot in snapshots:
+        # One column-wise pass per strategy marks the rows that could trigger,
+        # so state objects are only built for those (None = check every row)
+        margins = [snapshot["margin"] for snapshot in snapshots]
+        statuses = [snapshot["status"] for snapshot in snapshots]
+        masks = [
+            strategy.evaluate_batch(margins, statuses) for strategy in self.strategies
+        ]
+
+        for index, snapshot in enumerate(snapshots):
+            candidates = [
+                strategy
+                for strategy, mask in zip(self.strategies, masks, strict=True)
+                if strategy.name not in signaled and (mask is None or mask[index])
+            ]
+            if not candidates:
+                continue
+
             game_state = self._snapshot_to_game_state(snapshot)
 
             if not game_state.is_live:
@@ -218,17 +234,12 @@ class Backtester:
             # Create a simulated market state
             market_state = self._create_simulated_market(snapshot)
 
-            for strategy in self.strategies:
-                strategy_key = f"{strategy.name}:{snapshot['event_id']}"
-
-                if strategy_key in signaled:
-                    continue
-
+            for strategy in candidates:
                 signal = strategy.evaluate(game_state, market_state, None)
 
                 if signal and signal.is_actionable:
                     result.total_signals += 1
-                    signaled.add(strategy_key)
+                    signaled.add(strategy.name)
 
                     # Simulate the trade
                     trade = self._simulate_trade(
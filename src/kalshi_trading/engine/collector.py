@@ -103,15 +103,20 @@ class DataCollector:
         game_snapshots = 0
         market_snapshots = 0
 
+        # One timestamp for the whole cycle - every snapshot is taken "now"
+        snapshot_time = datetime.now().isoformat()
+
         for sport, games in all_games.items():
-            for game in games:
-                # Store game state
-                self.db.insert_game_state(game)
-                game_snapshots += 1
-
-                # Store market prices if Kalshi client available
-                if self.kalshi:
-                    captured = await self._capture_market_prices(game, sport)
+            # Store game states
+            self.db.insert_game_states(games, timestamp=snapshot_time)
+            game_snapshots += len(games)
+
+            # Store market prices if Kalshi client available
+            if self.kalshi:
+                for game in games:
+                    captured = await self._capture_market_prices(
+                        game, sport, snapshot_time
+                    )
                     market_snapshots += captured
 
         if game_snapshots > 0:
@@ -121,13 +126,19 @@ class DataCollector:
                 markets=market_snapshots,
             )
 
-    async def _capture_market_prices(self, game: GameState, sport: Sport) -> int:
+    async def _capture_market_prices(
+        self,
+        game: GameState,
+        sport: Sport,
+        snapshot_time: str | None = None,
+    ) -> int:
         """
         Capture Kalshi market prices for a game.
 
         Args:
             game: Game state from ESPN
             sport: Sport type
+            snapshot_time: ISO timestamp to record (defaults to now)
 
         Returns:
             Number of market snapshots captured
@@ -159,6 +170,7 @@ class DataCollector:
                         no_ask=market.no_ask,
                         volume=market.volume,
                         open_interest=market.open_interest,
+                        timestamp=snapshot_time,
                     )
                     captured += 1
 
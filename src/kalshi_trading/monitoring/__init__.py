@@ -1,11 +1,12 @@
 """Monitoring and logging utilities."""
 
 from .database import TradingDatabase
-from .logger import PerformanceTracker, TradeLogEntry, TradeLogger
+from .logger import PerformanceTracker, TradeLogEntry, TradeLogger, TradeLogRow
 
 __all__ = [
     "TradeLogger",
     "TradeLogEntry",
+    "TradeLogRow",
     "PerformanceTracker",
     "TradingDatabase",
 ]
@@ -1,11 +1,13 @@
 """SQLite database storage for trades, signals, and analytics."""
 
 import sqlite3
+import threading
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any
 
 from kalshi_trading.clients.espn import GameState
 from kalshi_trading.strategies.base import TradeSignal
@@ -16,11 +18,246 @@ def get_default_db_path() -> Path:
     return Path("data/trading.db")
 
 
+# Size of each connection's prepared-statement cache. Every SQL string below is
+# a module-level constant so repeated calls hit the cache instead of re-preparing.
+STATEMENT_CACHE_SIZE = 256
+
+_SQL_INSERT_TRADE = """
+    INSERT INTO trades (
+        timestamp, event_id, sport_id, matchup, ticker,
+        signal_type, side, size, price, fill_price,
+        status, strategy_id, reason, pnl
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+
+# Lookup-table upserts for dictionary-encoded names. The no-op DO UPDATE makes
+# RETURNING yield the existing id when the name is already known.
+_SQL_UPSERT_SPORT = """
+    INSERT INTO sports (name) VALUES (?)
+    ON CONFLICT(name) DO UPDATE SET name = excluded.name
+    RETURNING id
+"""
+
+_SQL_UPSERT_STRATEGY = """
+    INSERT INTO strategies (name) VALUES (?)
+    ON CONFLICT(name) DO UPDATE SET name = excluded.name
+    RETURNING id
+"""
+
+_SQL_INSERT_SIGNAL = """
+    INSERT INTO signals (
+        timestamp, event_id, sport, ticker,
+        signal_type, side, size, price,
+        strategy_name, reason, was_executed
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+
+_SQL_INSERT_GAME_STATE = """
+    INSERT INTO game_states (
+        timestamp, event_id, sport,
+        home_team, away_team,
+        home_score, away_score,
+        period, clock_seconds, status, margin
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+
+# Named-parameter form for raw row dicts; margin is derived from the scores
+_SQL_INSERT_GAME_STATE_ROW = """
+    INSERT INTO game_states (
+        timestamp, event_id, sport,
+        home_team, away_team,
+        home_score, away_score,
+        period, clock_seconds, status, margin
+    ) VALUES (
+        :timestamp, :event_id, :sport,
+        :home_team, :away_team,
+        :home_score, :away_score,
+        :period, :clock_seconds, :status, :home_score - :away_score
+    )
+"""
+
+_SQL_INSERT_MARKET_SNAPSHOT = """
+    INSERT INTO market_snapshots (
+        timestamp, event_id, ticker, sport,
+        yes_bid, yes_ask, no_bid, no_ask,
+        volume, open_interest
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+
+_SQL_MARKET_SNAPSHOTS_FOR_EVENT = """
+    SELECT * FROM market_snapshots
+    WHERE event_id = ?
+    ORDER BY timestamp
+"""
+
+_SQL_STRATEGY_PERFORMANCE = """
+    SELECT
+        SUM(trades) as total_trades,
+        SUM(trades) FILTER (WHERE status = 'executed') as executed,
+        SUM(trades) FILTER (WHERE status = 'dry_run') as dry_runs,
+        SUM(trades) FILTER (WHERE status = 'rejected') as rejected,
+        SUM(pnl) as total_pnl,
+        SUM(wins) as winning_trades,
+        SUM(losses) as losing_trades
+    FROM strategy_summary
+    WHERE 1=1
+"""
+
+# Breakdowns group on the integer ids and only join the names for display
+_SQL_PERFORMANCE_BY_SPORT = """
+    SELECT
+        sports.name as sport,
+        totals.*
+    FROM (
+        SELECT
+            sport_id,
+            SUM(trades) as total_trades,
+            SUM(pnl) as total_pnl,
+            SUM(wins) as wins,
+            SUM(losses) as losses
+        FROM strategy_summary
+        WHERE status = 'executed'
+        GROUP BY sport_id
+    ) AS totals
+    JOIN sports ON sports.id = totals.sport_id
+"""
+
+_SQL_PERFORMANCE_BY_STRATEGY = """
+    SELECT
+        strategies.name as strategy_name,
+        totals.*
+    FROM (
+        SELECT
+            strategy_id,
+            SUM(trades) as total_trades,
+            SUM(pnl) as total_pnl,
+            SUM(wins) as wins,
+            SUM(losses) as losses
+        FROM strategy_summary
+        WHERE status = 'executed'
+        GROUP BY strategy_id
+    ) AS totals
+    JOIN strategies ON strategies.id = totals.strategy_id
+"""
+
+_SQL_DAILY_PNL = """
+    SELECT
+        date,
+        executed_trades as trades,
+        total_pnl as pnl
+    FROM daily_summary
+    WHERE executed_trades > 0
+      AND date >= date('now', ?)
+    ORDER BY date
+"""
+
+_SQL_NEEDS_SUMMARY_BACKFILL = """
+    SELECT (EXISTS (SELECT 1 FROM trades) OR EXISTS (SELECT 1 FROM signals))
+       AND NOT EXISTS (SELECT 1 FROM daily_summary)
+"""
+
+_SQL_REBUILD_SUMMARIES = """
+    BEGIN;
+
+    DELETE FROM strategy_summary;
+    INSERT INTO strategy_summary (
+        date, strategy_id, sport_id, status, trades, pnl, wins, losses
+    )
+    SELECT
+        trade_date, strategy_id, sport_id, status,
+        COUNT(*),
+        COALESCE(SUM(pnl), 0),
+        COUNT(*) FILTER (WHERE pnl > 0),
+        COUNT(*) FILTER (WHERE pnl < 0)
+    FROM trades
+    GROUP BY trade_date, strategy_id, sport_id, status;
+
+    DELETE FROM daily_summary;
+    INSERT INTO daily_summary (
+        date, total_trades, executed_trades, dry_run_trades, rejected_trades,
+        total_pnl, winning_trades, losing_trades
+    )
+    SELECT
+        trade_date,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE status = 'executed'),
+        COUNT(*) FILTER (WHERE status = 'dry_run'),
+        COUNT(*) FILTER (WHERE status = 'rejected'),
+        COALESCE(SUM(pnl) FILTER (WHERE status = 'executed'), 0),
+        COUNT(*) FILTER (WHERE status = 'executed' AND pnl > 0),
+        COUNT(*) FILTER (WHERE status = 'executed' AND pnl < 0)
+    FROM trades
+    GROUP BY trade_date;
+
+    INSERT INTO daily_summary (date, total_signals)
+    SELECT signal_date, COUNT(*)
+    FROM signals
+    WHERE true
+    GROUP BY signal_date
+    ON CONFLICT(date) DO UPDATE SET total_signals = excluded.total_signals;
+
+    COMMIT;
+"""
+
+_SQL_RECENT_TRADES = """
+    SELECT
+        trades.id, trades.timestamp, trades.event_id,
+        sports.name as sport,
+        trades.matchup, trades.ticker, trades.signal_type, trades.side,
+        trades.size, trades.price, trades.fill_price, trades.status,
+        strategies.name as strategy_name,
+        trades.reason, trades.pnl, trades.created_at, trades.trade_date
+    FROM trades
+    JOIN sports ON sports.id = trades.sport_id
+    JOIN strategies ON strategies.id = trades.strategy_id
+    ORDER BY trades.timestamp DESC
+    LIMIT ?
+"""
+
+# Databases created before dictionary encoding store names directly on trades.
+# initialize() moves that table aside, recreates it, and copies rows over here.
+_SQL_COPY_LEGACY_TRADES = """
+    INSERT OR IGNORE INTO sports (name) SELECT DISTINCT sport FROM _legacy_trades;
+    INSERT OR IGNORE INTO strategies (name)
+        SELECT DISTINCT strategy_name FROM _legacy_trades;
+
+    INSERT INTO trades (
+        id, timestamp, event_id, sport_id, matchup, ticker,
+        signal_type, side, size, price, fill_price,
+        status, strategy_id, reason, pnl, created_at
+    )
+    SELECT
+        t.id, t.timestamp, t.event_id, sports.id, t.matchup, t.ticker,
+        t.signal_type, t.side, t.size, t.price, t.fill_price,
+        t.status, strategies.id, t.reason, t.pnl, t.created_at
+    FROM _legacy_trades AS t
+    JOIN sports ON sports.name = t.sport
+    JOIN strategies ON strategies.name = t.strategy_name
+    ORDER BY t.id;
+
+    DROP TABLE _legacy_trades;
+"""
+
+_SQL_SIGNAL_EXECUTION_RATE = """
+    SELECT
+        strategy_name,
+        COUNT(*) as total_signals,
+        SUM(was_executed) as executed_signals
+    FROM signals
+    GROUP BY strategy_name
+"""
+
+
 class TradingDatabase:
     """
     SQLite database for storing trading data and analytics.
 
     Stores trades, signals, game states, and provides analytics queries.
+    Analytics read from summary tables that triggers keep current on insert.
 
     Example:
         db = TradingDatabase()
@@ -34,12 +271,23 @@ class TradingDatabase:
     """
 
     SCHEMA = """
+    -- Lookup tables: sport and strategy names are stored once, referenced by id
+    CREATE TABLE IF NOT EXISTS sports (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    );
+
+    CREATE TABLE IF NOT EXISTS strategies (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    );
+
     -- Trades table: all executed and dry-run trades
     CREATE TABLE IF NOT EXISTS trades (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         timestamp TEXT NOT NULL,
         event_id TEXT NOT NULL,
-        sport TEXT NOT NULL,
+        sport_id INTEGER NOT NULL REFERENCES sports(id),
         matchup TEXT NOT NULL,
         ticker TEXT NOT NULL,
         signal_type TEXT NOT NULL,  -- buy, sell, hold
@@ -48,10 +296,11 @@ class TradingDatabase:
         price INTEGER,              -- in cents
         fill_price INTEGER,         -- actual fill price
         status TEXT NOT NULL,       -- executed, rejected, dry_run
-        strategy_name TEXT NOT NULL,
+        strategy_id INTEGER NOT NULL REFERENCES strategies(id),
         reason TEXT,
         pnl INTEGER DEFAULT 0,      -- realized P&L in cents
-        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        trade_date TEXT GENERATED ALWAYS AS (substr(timestamp, 1, 10)) VIRTUAL
     );
 
     -- Signals table: all signals generated (for analysis)
@@ -68,7 +317,8 @@ class TradingDatabase:
         strategy_name TEXT NOT NULL,
         reason TEXT,
         was_executed INTEGER DEFAULT 0,  -- boolean
-        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        signal_date TEXT GENERATED ALWAYS AS (substr(timestamp, 1, 10)) VIRTUAL
     );
 
     -- Game states table: snapshots of game data
@@ -85,10 +335,11 @@ class TradingDatabase:
         clock_seconds REAL NOT NULL,
         status TEXT NOT NULL,       -- pre, in, post
         margin INTEGER NOT NULL,
-        created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        snapshot_date TEXT GENERATED ALWAYS AS (substr(timestamp, 1, 10)) VIRTUAL
     );
 
-    -- Daily summary table: aggregated daily stats
+    -- Daily summary table: aggregated daily stats (executed P&L), maintained by triggers
     CREATE TABLE IF NOT EXISTS daily_summary (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         date TEXT NOT NULL UNIQUE,
@@ -120,11 +371,72 @@ class TradingDatabase:
         created_at TEXT DEFAULT CURRENT_TIMESTAMP
     );
 
+    -- Strategy summary table: per-day rollup of trades, maintained by triggers
+    CREATE TABLE IF NOT EXISTS strategy_summary (
+        date TEXT NOT NULL,
+        strategy_id INTEGER NOT NULL,
+        sport_id INTEGER NOT NULL,
+        status TEXT NOT NULL,              -- executed, rejected, dry_run
+        trades INTEGER DEFAULT 0,
+        pnl INTEGER DEFAULT 0,             -- in cents
+        wins INTEGER DEFAULT 0,
+        losses INTEGER DEFAULT 0,
+        PRIMARY KEY (date, strategy_id, sport_id, status)
+    );
+
+    -- Rollup triggers: keep summaries current as rows are inserted
+    CREATE TRIGGER IF NOT EXISTS trg_trades_strategy_summary
+    AFTER INSERT ON trades
+    BEGIN
+        INSERT INTO strategy_summary (
+            date, strategy_id, sport_id, status, trades, pnl, wins, losses
+        ) VALUES (
+            NEW.trade_date, NEW.strategy_id, NEW.sport_id, NEW.status,
+            1, COALESCE(NEW.pnl, 0), NEW.pnl > 0, NEW.pnl < 0
+        )
+        ON CONFLICT(date, strategy_id, sport_id, status) DO UPDATE SET
+            trades = trades + 1,
+            pnl = pnl + excluded.pnl,
+            wins = wins + excluded.wins,
+            losses = losses + excluded.losses;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_trades_daily_summary
+    AFTER INSERT ON trades
+    BEGIN
+        INSERT INTO daily_summary (
+            date, total_trades, executed_trades, dry_run_trades, rejected_trades,
+            total_pnl, winning_trades, losing_trades
+        ) VALUES (
+            NEW.trade_date, 1,
+            NEW.status = 'executed', NEW.status = 'dry_run', NEW.status = 'rejected',
+            CASE WHEN NEW.status = 'executed' THEN COALESCE(NEW.pnl, 0) ELSE 0 END,
+            NEW.status = 'executed' AND NEW.pnl > 0,
+            NEW.status = 'executed' AND NEW.pnl < 0
+        )
+        ON CONFLICT(date) DO UPDATE SET
+            total_trades = total_trades + 1,
+            executed_trades = executed_trades + excluded.executed_trades,
+            dry_run_trades = dry_run_trades + excluded.dry_run_trades,
+            rejected_trades = rejected_trades + excluded.rejected_trades,
+            total_pnl = total_pnl + excluded.total_pnl,
+            winning_trades = winning_trades + excluded.winning_trades,
+            losing_trades = losing_trades + excluded.losing_trades,
+            updated_at = CURRENT_TIMESTAMP;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS trg_signals_daily_summary
+    AFTER INSERT ON signals
+    BEGIN
+        INSERT INTO daily_summary (date, total_signals)
+        VALUES (NEW.signal_date, 1)
+        ON CONFLICT(date) DO UPDATE SET
+            total_signals = total_signals + 1,
+            updated_at = CURRENT_TIMESTAMP;
+    END;
+
     -- Indexes for common queries
     CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp);
-    CREATE INDEX IF NOT EXISTS idx_trades_strategy ON trades(strategy_name);
-    CREATE INDEX IF NOT EXISTS idx_trades_sport ON trades(sport);
-    CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status);
     CREATE INDEX IF NOT EXISTS idx_signals_timestamp ON signals(timestamp);
     CREATE INDEX IF NOT EXISTS idx_signals_strategy ON signals(strategy_name);
     CREATE INDEX IF NOT EXISTS idx_game_states_event ON game_states(event_id);
@@ -132,6 +444,39 @@ class TradingDatabase:
     CREATE INDEX IF NOT EXISTS idx_market_snapshots_event ON market_snapshots(event_id);
     CREATE INDEX IF NOT EXISTS idx_market_snapshots_ticker ON market_snapshots(ticker);
     CREATE INDEX IF NOT EXISTS idx_market_snapshots_timestamp ON market_snapshots(timestamp);
+
+    -- Covering indexes so rollup aggregations never touch the base rows.
+    -- The executed-only breakdowns use partial indexes that skip other statuses
+    -- (status is carried as a trailing column so the plan stays index-only).
+    CREATE INDEX IF NOT EXISTS idx_strategy_summary_executed_strategy
+        ON strategy_summary(strategy_id, trades, pnl, wins, losses, status)
+        WHERE status = 'executed';
+    CREATE INDEX IF NOT EXISTS idx_strategy_summary_executed_sport
+        ON strategy_summary(sport_id, trades, pnl, wins, losses, status)
+        WHERE status = 'executed';
+    CREATE INDEX IF NOT EXISTS idx_strategy_summary_strategy_date
+        ON strategy_summary(strategy_id, date, status, trades, pnl, wins, losses);
+
+    -- Indexes superseded by the rollup and partial indexes (only slow inserts)
+    DROP INDEX IF EXISTS idx_trades_strategy;
+    DROP INDEX IF EXISTS idx_trades_sport;
+    DROP INDEX IF EXISTS idx_trades_status;
+    """
+
+    # Indexed YYYY-MM-DD columns derived from each table's ISO timestamp, so date
+    # filters are range scans instead of evaluating date() on every row. ALTER
+    # TABLE can only add VIRTUAL generated columns, so older databases get them
+    # added by initialize() and the indexes are created afterwards.
+    DATE_COLUMNS = {
+        "trades": "trade_date",
+        "signals": "signal_date",
+        "game_states": "snapshot_date",
+    }
+
+    DATE_INDEXES = """
+    CREATE INDEX IF NOT EXISTS idx_trades_date ON trades(trade_date);
+    CREATE INDEX IF NOT EXISTS idx_signals_date ON signals(signal_date);
+    CREATE INDEX IF NOT EXISTS idx_game_states_date ON game_states(snapshot_date);
     """
 
     def __init__(self, db_path: Path | str | None = None):
@@ -139,32 +484,132 @@ class TradingDatabase:
         Initialize database connection.
 
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file (":memory:" gives each
+                thread its own private in-memory database)
         """
         self.db_path = Path(db_path) if db_path else get_default_db_path()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # One long-lived connection per thread so the statement cache survives,
+        # with {name: id} caches for the sports/strategies lookup tables kept
+        # beside it (ids are only valid for the database that connection sees)
+        self._local = threading.local()
+
+        # Every connection opened on any thread, so close() can close them all
+        self._connections: set[sqlite3.Connection] = set()
+        self._connections_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use or after close()."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None or conn not in self._connections:
+            # Only this thread uses the connection; close() may run elsewhere
+            conn = sqlite3.connect(
+                str(self.db_path),
+                cached_statements=STATEMENT_CACHE_SIZE,
+                check_same_thread=False,
+            )
+            conn.row_factory = sqlite3.Row
+            with self._connections_lock:
+                self._connections.add(conn)
+            self._local.conn = conn
+            self._local.sport_ids = {}
+            self._local.strategy_ids = {}
+        return conn
+
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get database connection as context manager."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """Get database connection as context manager (commits on success)."""
+        conn = self._connect()
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
-        finally:
+
+    def close(self) -> None:
+        """
+        Close the connections opened on every thread.
+
+        Call once other threads are done with the database; any thread that
+        uses it afterwards opens a fresh connection.
+        """
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for conn in connections:
             conn.close()
+        self._local.conn = None
 
     def initialize(self) -> None:
         """Create database tables if they don't exist."""
         with self._get_connection() as conn:
+            legacy_trades = self._move_legacy_trades(conn)
             conn.executescript(self.SCHEMA)
+            self._add_date_columns(conn)
+            conn.executescript(self.DATE_INDEXES)
+            if legacy_trades:
+                conn.executescript(_SQL_COPY_LEGACY_TRADES)
+
+            # Databases created before the rollup triggers existed need a backfill,
+            # and migrated trades were double-counted by the triggers on copy
+            if legacy_trades or conn.execute(_SQL_NEEDS_SUMMARY_BACKFILL).fetchone()[0]:
+                conn.executescript(_SQL_REBUILD_SUMMARIES)
+
+    def _move_legacy_trades(self, conn: sqlite3.Connection) -> bool:
+        """
+        Rename a trades table that stores sport/strategy names inline.
+
+        Its indexes and triggers move with it, so they are dropped for the
+        schema to recreate on the new table. The name-keyed strategy rollup
+        is dropped too and rebuilt once the rows are copied.
+
+        Returns:
+            True if a legacy table was moved aside
+        """
+        columns = {row["name"] for row in conn.execute("PRAGMA table_xinfo(trades)")}
+        if "sport" not in columns:
+            return False
+
+        conn.execute("ALTER TABLE trades RENAME TO _legacy_trades")
+        attached = conn.execute(
+            "SELECT type, name FROM sqlite_master "
+            "WHERE tbl_name = '_legacy_trades' AND type IN ('index', 'trigger') "
+            "AND sql IS NOT NULL"
+        ).fetchall()
+        for row in attached:
+            conn.execute(f"DROP {row['type'].upper()} {row['name']}")
+        conn.execute("DROP TABLE IF EXISTS strategy_summary")
+        return True
+
+    def _add_date_columns(self, conn: sqlite3.Connection) -> None:
+        """Add generated date columns to tables created before they existed."""
+        for table, column in self.DATE_COLUMNS.items():
+            existing = {row["name"] for row in conn.execute(f"PRAGMA table_xinfo({table})")}
+            if column not in existing:
+                conn.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {column} TEXT "
+                    "GENERATED ALWAYS AS (substr(timestamp, 1, 10)) VIRTUAL"
+                )
+
+    def rebuild_summaries(self) -> None:
+        """Recompute the daily and strategy rollup tables from raw trades/signals."""
+        with self._get_connection() as conn:
+            conn.executescript(_SQL_REBUILD_SUMMARIES)
 
     # -- Insert Methods --
 
+    def _name_id(self, cache: dict[str, int], sql: str, name: str) -> int:
+        """Resolve a sport/strategy name to its lookup id, adding it on first sight."""
+        name_id = cache.get(name)
+        if name_id is None:
+            # Committed on its own so a rolled-back insert can't leave a stale id cached
+            with self._get_connection() as conn:
+                name_id = int(conn.execute(sql, (name,)).fetchone()[0])
+            cache[name] = name_id
+        return name_id
+
     def insert_trade(
         self,
         signal: TradeSignal,
@@ -192,19 +637,18 @@ class TradingDatabase:
         Returns:
             Inserted row ID
         """
+        self._connect()
+        sport_id = self._name_id(self._local.sport_ids, _SQL_UPSERT_SPORT, sport)
+        strategy_id = self._name_id(
+            self._local.strategy_ids, _SQL_UPSERT_STRATEGY, strategy_name
+        )
         with self._get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO trades (
-                    timestamp, event_id, sport, matchup, ticker,
-                    signal_type, side, size, price, fill_price,
-                    status, strategy_name, reason, pnl
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_TRADE,
                 (
                     signal.timestamp.isoformat(),
                     event_id,
-                    sport,
+                    sport_id,
                     matchup,
                     signal.ticker,
                     signal.signal.value,
@@ -213,12 +657,12 @@ class TradingDatabase:
                     signal.price,
                     fill_price,
                     status,
-                    strategy_name,
+                    strategy_id,
                     signal.reason,
                     pnl,
                 ),
             )
-            return cursor.lastrowid or 0
+            return int(cursor.fetchone()[0])
 
     def insert_signal(
         self,
@@ -231,13 +675,7 @@ class TradingDatabase:
         """Insert a signal record for analysis."""
         with self._get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO signals (
-                    timestamp, event_id, sport, ticker,
-                    signal_type, side, size, price,
-                    strategy_name, reason, was_executed
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_SIGNAL,
                 (
                     signal.timestamp.isoformat(),
                     event_id,
@@ -252,35 +690,97 @@ class TradingDatabase:
                     1 if was_executed else 0,
                 ),
             )
-            return cursor.lastrowid or 0
+            return int(cursor.fetchone()[0])
+
+    @staticmethod
+    def _game_state_row(game: GameState, timestamp: str) -> tuple[Any, ...]:
+        """Build the game_states insert parameters for a snapshot."""
+        return (
+            timestamp,
+            game.event_id,
+            game.sport,
+            game.home_team.abbreviation,
+            game.away_team.abbreviation,
+            game.home_score,
+            game.away_score,
+            game.period,
+            game.clock_seconds,
+            game.status.value,
+            game.margin,
+        )
+
+    def insert_game_state(self, game: GameState, timestamp: str | None = None) -> int:
+        """
+        Insert a game state snapshot.
+
+        Args:
+            game: Game state to store
+            timestamp: ISO snapshot time (defaults to now)
 
-    def insert_game_state(self, game: GameState) -> int:
-        """Insert a game state snapshot."""
+        Returns:
+            Inserted row ID
+        """
         with self._get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO game_states (
-                    timestamp, event_id, sport,
-                    home_team, away_team,
-                    home_score, away_score,
-                    period, clock_seconds, status, margin
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    datetime.now().isoformat(),
-                    game.event_id,
-                    game.sport,
-                    game.home_team.abbreviation,
-                    game.away_team.abbreviation,
-                    game.home_score,
-                    game.away_score,
-                    game.period,
-                    game.clock_seconds,
-                    game.status.value,
-                    game.margin,
-                ),
+                _SQL_INSERT_GAME_STATE,
+                self._game_state_row(game, timestamp or datetime.now().isoformat()),
             )
-            return cursor.lastrowid or 0
+            return int(cursor.fetchone()[0])
+
+    def insert_game_states(
+        self, games: Iterable[GameState], timestamp: str | None = None
+    ) -> list[int]:
+        """
+        Insert a batch of game state snapshots taken at the same time.
+
+        All rows go in one transaction through the same cached statement.
+        executemany() discards RETURNING rows, so rows are stepped one by one
+        to collect their IDs.
+
+        Args:
+            games: Game states to store
+            timestamp: ISO snapshot time shared by every row (defaults to now)
+
+        Returns:
+            Inserted row IDs, in input order
+        """
+        snapshot_time = timestamp or datetime.now().isoformat()
+        with self._get_connection() as conn:
+            return [
+                int(
+                    conn.execute(
+                        _SQL_INSERT_GAME_STATE,
+                        self._game_state_row(game, snapshot_time),
+                    ).fetchone()[0]
+                )
+                for game in games
+            ]
+
+    def insert_game_states_bulk(
+        self, rows: Iterable[dict[str, Any]], timestamp: str | None = None
+    ) -> int:
+        """
+        Insert raw game state rows with a single executemany() call.
+
+        For loading snapshot data that isn't already in GameState form
+        (imports, test fixtures). Row IDs are not returned.
+
+        Args:
+            rows: Dicts with event_id, sport, home_team, away_team (abbreviations),
+                home_score, away_score, period, clock_seconds and status
+                ("pre", "in", "post"); an optional timestamp overrides the default
+            timestamp: ISO snapshot time for rows without one (defaults to now)
+
+        Returns:
+            Number of rows inserted
+        """
+        snapshot_time = timestamp or datetime.now().isoformat()
+        with self._get_connection() as conn:
+            cursor = conn.executemany(
+                _SQL_INSERT_GAME_STATE_ROW,
+                ({"timestamp": snapshot_time, **row} for row in rows),
+            )
+            return cursor.rowcount
 
     def insert_market_snapshot(
         self,
@@ -293,6 +793,7 @@ class TradingDatabase:
         no_ask: int,
         volume: int = 0,
         open_interest: int = 0,
+        timestamp: str | None = None,
     ) -> int:
         """
         Insert a market price snapshot.
@@ -305,21 +806,16 @@ class TradingDatabase:
             no_bid/no_ask: NO side prices in cents
             volume: Trading volume
             open_interest: Open interest
+            timestamp: ISO snapshot time (defaults to now)
 
         Returns:
             Inserted row ID
         """
         with self._get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO market_snapshots (
-                    timestamp, event_id, ticker, sport,
-                    yes_bid, yes_ask, no_bid, no_ask,
-                    volume, open_interest
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_MARKET_SNAPSHOT,
                 (
-                    datetime.now().isoformat(),
+                    timestamp or datetime.now().isoformat(),
                     event_id,
                     ticker,
                     sport,
@@ -331,17 +827,12 @@ class TradingDatabase:
                     open_interest,
                 ),
             )
-            return cursor.lastrowid or 0
+            return int(cursor.fetchone()[0])
 
     def get_market_snapshots_for_event(self, event_id: str) -> list[dict[str, Any]]:
         """Get all market snapshots for an event."""
-        query = """
-            SELECT * FROM market_snapshots
-            WHERE event_id = ?
-            ORDER BY timestamp
-        """
         with self._get_connection() as conn:
-            rows = conn.execute(query, (event_id,)).fetchall()
+            rows = conn.execute(_SQL_MARKET_SNAPSHOTS_FOR_EVENT, (event_id,)).fetchall()
             return [dict(row) for row in rows]
 
     # -- Analytics Queries --
@@ -363,35 +854,23 @@ class TradingDatabase:
         Returns:
             Dict with performance metrics
         """
-        query = """
-            SELECT
-                COUNT(*) as total_trades,
-                SUM(CASE WHEN status = 'executed' THEN 1 ELSE 0 END) as executed,
-                SUM(CASE WHEN status = 'dry_run' THEN 1 ELSE 0 END) as dry_runs,
-                SUM(CASE WHEN status = 'rejected' THEN 1 ELSE 0 END) as rejected,
-                SUM(pnl) as total_pnl,
-                SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as winning_trades,
-                SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END) as losing_trades,
-                AVG(pnl) as avg_pnl
-            FROM trades
-            WHERE 1=1
-        """
+        query = _SQL_STRATEGY_PERFORMANCE
         params: list[Any] = []
 
         if strategy_name:
-            query += " AND strategy_name = ?"
+            query += " AND strategy_id = (SELECT id FROM strategies WHERE name = ?)"
             params.append(strategy_name)
         if start_date:
-            query += " AND date(timestamp) >= ?"
+            query += " AND date >= ?"
             params.append(start_date)
         if end_date:
-            query += " AND date(timestamp) <= ?"
+            query += " AND date <= ?"
             params.append(end_date)
 
         with self._get_connection() as conn:
             row = conn.execute(query, params).fetchone()
 
-            if not row or row["total_trades"] == 0:
+            if not row or not row["total_trades"]:
                 return {
                     "total_trades": 0,
                     "executed": 0,
@@ -405,38 +884,28 @@ class TradingDatabase:
                     "avg_pnl": 0.0,
                 }
 
+            total_trades = row["total_trades"]
+            total_pnl = row["total_pnl"] or 0
             executed = row["executed"] or 0
             winning = row["winning_trades"] or 0
 
             return {
-                "total_trades": row["total_trades"],
+                "total_trades": total_trades,
                 "executed": executed,
                 "dry_runs": row["dry_runs"] or 0,
                 "rejected": row["rejected"] or 0,
-                "total_pnl": row["total_pnl"] or 0,
-                "total_pnl_dollars": (row["total_pnl"] or 0) / 100,
+                "total_pnl": total_pnl,
+                "total_pnl_dollars": total_pnl / 100,
                 "winning_trades": winning,
                 "losing_trades": row["losing_trades"] or 0,
                 "win_rate": winning / executed if executed > 0 else 0.0,
-                "avg_pnl": row["avg_pnl"] or 0.0,
+                "avg_pnl": total_pnl / total_trades,
             }
 
     def get_performance_by_sport(self) -> dict[str, dict[str, Any]]:
         """Get performance metrics grouped by sport."""
-        query = """
-            SELECT
-                sport,
-                COUNT(*) as total_trades,
-                SUM(pnl) as total_pnl,
-                SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as wins,
-                SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END) as losses
-            FROM trades
-            WHERE status = 'executed'
-            GROUP BY sport
-        """
-
         with self._get_connection() as conn:
-            rows = conn.execute(query).fetchall()
+            rows = conn.execute(_SQL_PERFORMANCE_BY_SPORT).fetchall()
 
             result = {}
             for row in rows:
@@ -455,20 +924,8 @@ class TradingDatabase:
 
     def get_performance_by_strategy(self) -> dict[str, dict[str, Any]]:
         """Get performance metrics grouped by strategy."""
-        query = """
-            SELECT
-                strategy_name,
-                COUNT(*) as total_trades,
-                SUM(pnl) as total_pnl,
-                SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as wins,
-                SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END) as losses
-            FROM trades
-            WHERE status = 'executed'
-            GROUP BY strategy_name
-        """
-
         with self._get_connection() as conn:
-            rows = conn.execute(query).fetchall()
+            rows = conn.execute(_SQL_PERFORMANCE_BY_STRATEGY).fetchall()
 
             result = {}
             for row in rows:
@@ -487,20 +944,8 @@ class TradingDatabase:
 
     def get_daily_pnl(self, days: int = 30) -> list[dict[str, Any]]:
         """Get daily P&L for the last N days."""
-        query = """
-            SELECT
-                date(timestamp) as date,
-                COUNT(*) as trades,
-                SUM(pnl) as pnl
-            FROM trades
-            WHERE status = 'executed'
-              AND date(timestamp) >= date('now', ?)
-            GROUP BY date(timestamp)
-            ORDER BY date(timestamp)
-        """
-
         with self._get_connection() as conn:
-            rows = conn.execute(query, (f"-{days} days",)).fetchall()
+            rows = conn.execute(_SQL_DAILY_PNL, (f"-{days} days",)).fetchall()
 
             return [
                 {
@@ -514,29 +959,14 @@ class TradingDatabase:
 
     def get_recent_trades(self, limit: int = 50) -> list[dict[str, Any]]:
         """Get most recent trades."""
-        query = """
-            SELECT * FROM trades
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """
-
         with self._get_connection() as conn:
-            rows = conn.execute(query, (limit,)).fetchall()
+            rows = conn.execute(_SQL_RECENT_TRADES, (limit,)).fetchall()
             return [dict(row) for row in rows]
 
     def get_signal_execution_rate(self) -> dict[str, float]:
         """Get signal execution rate by strategy."""
-        query = """
-            SELECT
-                strategy_name,
-                COUNT(*) as total_signals,
-                SUM(was_executed) as executed_signals
-            FROM signals
-            GROUP BY strategy_name
-        """
-
         with self._get_connection() as conn:
-            rows = conn.execute(query).fetchall()
+            rows = conn.execute(_SQL_SIGNAL_EXECUTION_RATE).fetchall()
 
             return {
                 row["strategy_name"]: (
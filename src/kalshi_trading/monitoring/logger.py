@@ -1,11 +1,21 @@
 """Trade logging and audit trail."""
 
-import json
-from dataclasses import asdict, dataclass
-from datetime import datetime
+import atexit
+import os
+import queue
+import threading
+import time
+import weakref
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, NamedTuple
 
+import orjson
 import structlog
 
 from kalshi_trading.engine.risk import TradeRecord
@@ -13,8 +23,27 @@ from kalshi_trading.strategies.base import TradeSignal
 
 logger = structlog.get_logger()
 
+# Write buffer for the open JSONL handle
+WRITE_BUFFER_SIZE = 64 * 1024
 
-@dataclass
+# Max threads used to read day files for a period summary
+MAX_READ_WORKERS = 8
+
+# Parsed day files kept in memory, reused until the file changes
+MAX_CACHED_DAYS = 31
+
+# Loggers with a writer thread or open file handle, drained at interpreter exit
+_open_loggers: "weakref.WeakSet[TradeLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_loggers() -> None:
+    """Write out any queued or buffered entries before the interpreter exits."""
+    for trade_logger in list(_open_loggers):
+        trade_logger.close()
+
+
+@dataclass(slots=True)
 class TradeLogEntry:
     """Complete log entry for a trade."""
 
@@ -34,43 +63,136 @@ class TradeLogEntry:
     risk_check: bool
     pnl: int = 0
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a flat dict (fields are immutable, so no deep copy)."""
+        return {
+            "timestamp": self.timestamp,
+            "event_id": self.event_id,
+            "sport": self.sport,
+            "matchup": self.matchup,
+            "ticker": self.ticker,
+            "signal": self.signal,
+            "side": self.side,
+            "size": self.size,
+            "price": self.price,
+            "fill_price": self.fill_price,
+            "status": self.status,
+            "reason": self.reason,
+            "strategy_name": self.strategy_name,
+            "risk_check": self.risk_check,
+            "pnl": self.pnl,
+        }
+
+
+class TradeLogRow(NamedTuple):
+    """Read-only tuple form of TradeLogEntry for analytics over a day's trades."""
+
+    timestamp: str
+    event_id: str
+    sport: str
+    matchup: str
+    ticker: str
+    signal: str
+    side: str
+    size: int
+    price: int | None
+    fill_price: int | None
+    status: str
+    reason: str
+    strategy_name: str
+    risk_check: bool
+    pnl: int = 0
+
+
+# Pulls an entry's fields out of a parsed JSON line in constructor order
+_get_entry_fields = itemgetter(*TradeLogRow._fields)
+
+
+def _entry_values(data: dict[str, Any]) -> tuple[Any, ...]:
+    """Get a parsed log line's field values, positionally, for TradeLogEntry/TradeLogRow."""
+    try:
+        values: tuple[Any, ...] = _get_entry_fields(data)
+    except KeyError:
+        # Older or hand-written lines may lack defaulted fields such as pnl
+        values = _get_entry_fields({**TradeLogRow._field_defaults, **data})
+    return values
+
 
 class TradeLogger:
     """
     Logs all trade activity to file and structured logs.
 
     Creates a JSON Lines file with one trade per line for easy analysis.
+    The day's file stays open with a write buffer; entries are flushed (and
+    fsynced) every ``flush_every`` writes, on flush()/close(), and at
+    interpreter exit. With ``background=True`` file writes move to a writer
+    thread so log_signal() only queues the entry; write errors are then logged
+    rather than raised to the caller.
 
     Example:
         logger = TradeLogger(Path("logs"))
         logger.log_signal(signal, game, "nfl_spread", executed=True)
     """
 
-    def __init__(self, log_dir: Path | None = None):
+    def __init__(
+        self,
+        log_dir: Path | None = None,
+        flush_every: int = 100,
+        background: bool = False,
+        sink: Callable[[bytes], Any] | None = None,
+    ):
         """
         Initialize trade logger.
 
         Args:
             log_dir: Directory for log files (created if needed)
+            flush_every: Number of entries to buffer before flushing to disk
+            background: Write entries on a background thread instead of inline;
+                failed writes are logged, not raised from log_signal()
+            sink: Callable given each JSONL line instead of the day file
+                (e.g. ``list.append`` in tests); entries sent to a sink are
+                not visible to get_trades_for_date()
         """
         self.log_dir = log_dir or Path("logs")
         self.log_dir.mkdir(parents=True, exist_ok=True)
-
-        # Daily log file
+        self.flush_every = max(1, flush_every)
+        self.background = background
+        self._sink = sink
+
+        # Entries waiting for the writer thread (None asks it to stop)
+        self._queue: queue.Queue[TradeLogEntry | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        # Guards starting/stopping the writer so concurrent callers start one thread
+        self._writer_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+        # Daily log file, recomputed only once the clock passes local midnight
         self._current_date: str = ""
         self._log_file: Path | None = None
+        self._next_rollover: float = 0.0
+
+        # Open append handle and entries written since the last flush
+        self._fh: BinaryIO | None = None
+        self._fh_path: Path | None = None
+        self._pending = 0
+
+        # Parsed day files by date, tagged with the (mtime_ns, size) they were read at
+        self._day_cache: dict[str, tuple[tuple[int, int], list[dict[str, Any]]]] = {}
+        self._day_cache_lock = threading.Lock()
 
     def _get_log_file(self) -> Path:
         """Get current day's log file."""
-        today = datetime.now().strftime("%Y-%m-%d")
+        if time.time() >= self._next_rollover:
+            now = datetime.now()
+            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        if today != self._current_date:
-            self._current_date = today
-            self._log_file = self.log_dir / f"trades_{today}.jsonl"
+            self._current_date = now.strftime("%Y-%m-%d")
+            self._log_file = self.log_dir / f"trades_{self._current_date}.jsonl"
+            self._next_rollover = (midnight + timedelta(days=1)).timestamp()
 
         return self._log_file  # type: ignore
 
-    def log_signal(
+    def _make_entry(
         self,
         signal: TradeSignal,
         event_id: str,
@@ -82,22 +204,8 @@ class TradeLogger:
         fill_price: int | None = None,
         pnl: int = 0,
         dry_run: bool = False,
-    ) -> None:
-        """
-        Log a trade signal.
-
-        Args:
-            signal: The trade signal
-            event_id: ESPN event ID
-            sport: Sport type (nfl, nba, etc.)
-            matchup: Game matchup string
-            strategy_name: Name of strategy that generated signal
-            executed: Whether trade was executed
-            rejected_reason: Reason if rejected
-            fill_price: Actual fill price if executed
-            pnl: Realized P&L if any
-            dry_run: Whether this was a dry run
-        """
+    ) -> TradeLogEntry:
+        """Build a log entry for a signal and emit it to the structured log."""
         # Determine status
         if dry_run:
             status = "dry_run"
@@ -127,18 +235,178 @@ class TradeLogger:
         # Log to structured logger
         logger.info(
             "Trade signal",
-            **asdict(entry),
+            **entry.to_dict(),
         )
+        return entry
 
-        # Append to file
-        self._write_entry(entry)
+    def log_signal(
+        self,
+        signal: TradeSignal,
+        event_id: str,
+        sport: str,
+        matchup: str,
+        strategy_name: str,
+        executed: bool = False,
+        rejected_reason: str | None = None,
+        fill_price: int | None = None,
+        pnl: int = 0,
+        dry_run: bool = False,
+    ) -> None:
+        """
+        Log a trade signal.
+
+        Args:
+            signal: The trade signal
+            event_id: ESPN event ID
+            sport: Sport type (nfl, nba, etc.)
+            matchup: Game matchup string
+            strategy_name: Name of strategy that generated signal
+            executed: Whether trade was executed
+            rejected_reason: Reason if rejected
+            fill_price: Actual fill price if executed
+            pnl: Realized P&L if any
+            dry_run: Whether this was a dry run
+        """
+        entry = self._make_entry(
+            signal,
+            event_id,
+            sport,
+            matchup,
+            strategy_name,
+            executed=executed,
+            rejected_reason=rejected_reason,
+            fill_price=fill_price,
+            pnl=pnl,
+            dry_run=dry_run,
+        )
+        self._append([entry])
+
+    def log_signals(self, signals: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Log several trade signals with a single write.
+
+        Args:
+            signals: One mapping of log_signal() keyword arguments per signal
 
-    def _write_entry(self, entry: TradeLogEntry) -> None:
-        """Write entry to log file."""
+        Returns:
+            Number of signals logged
+        """
+        entries = [self._make_entry(**kwargs) for kwargs in signals]
+        if entries:
+            self._append(entries)
+        return len(entries)
+
+    def _append(self, entries: list[TradeLogEntry]) -> None:
+        """Queue entries for the writer thread, or write them inline."""
+        if self.background:
+            with self._writer_lock:
+                self._ensure_writer()
+                for entry in entries:
+                    self._queue.put(entry)
+        else:
+            with self._lock:
+                self._write_entries(entries)
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer thread if it isn't running (caller holds _writer_lock)."""
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(
+                target=self._drain_loop,
+                name="trade-log-writer",
+                daemon=True,
+            )
+            self._writer.start()
+            _open_loggers.add(self)
+
+    def _drain_loop(self) -> None:
+        """Write queued entries in batches until asked to stop."""
+        running = True
+        while running:
+            batch = [self._queue.get()]
+
+            # Pick up everything else already queued in the same pass
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            entries = [entry for entry in batch if entry is not None]
+            running = len(entries) == len(batch)
+
+            try:
+                with self._lock:
+                    self._write_entries(entries)
+            except Exception as e:
+                logger.error("Failed to write trade log entries", error=str(e))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _get_handle(self) -> BinaryIO:
+        """Get the open append handle for the current day's log file."""
         log_file = self._get_log_file()
 
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(asdict(entry)) + "\n")
+        if self._fh is None or self._fh_path != log_file:
+            # Day rolled over (or first write) - finish the previous file
+            self._close_handle()
+            self._fh = open(log_file, "ab", buffering=WRITE_BUFFER_SIZE)
+            self._fh_path = log_file
+            _open_loggers.add(self)
+
+        return self._fh
+
+    def _write_entries(self, entries: list[TradeLogEntry]) -> None:
+        """Write entries to log file (caller holds the lock)."""
+        if not entries:
+            return
+
+        # orjson serializes the slotted dataclass directly - no intermediate dict
+        lines = [orjson.dumps(e, option=orjson.OPT_APPEND_NEWLINE) for e in entries]
+        if self._sink is not None:
+            for line in lines:
+                self._sink(line)
+            return
+
+        self._get_handle().writelines(lines)
+
+        self._pending += len(lines)
+        if self._pending >= self.flush_every:
+            self._flush_handle()
+
+    def _flush_handle(self) -> None:
+        """Flush the file buffer to disk with a single fsync."""
+        if self._fh is not None and self._pending:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+        self._pending = 0
+
+    def _close_handle(self) -> None:
+        """Flush and close the current file handle, if any."""
+        if self._fh is not None:
+            self._flush_handle()
+            self._fh.close()
+            self._fh = None
+            self._fh_path = None
+
+    def flush(self) -> None:
+        """Wait for queued entries to be written, then flush them to disk."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.join()
+        with self._lock:
+            self._flush_handle()
+
+    def close(self) -> None:
+        """Stop the writer thread and close the log file (restarted on next write)."""
+        with self._writer_lock:
+            if self._writer is not None and self._writer.is_alive():
+                self._queue.put(None)
+                self._writer.join()
+            self._writer = None
+
+        with self._lock:
+            self._close_handle()
+        _open_loggers.discard(self)
 
     def log_risk_block(
         self,
@@ -156,6 +424,56 @@ class TradeLogger:
             strategy=strategy_name,
         )
 
+    def _load_day(self, date: str) -> list[dict[str, Any]]:
+        """
+        Parse a day's JSONL file into dicts, one orjson call per line.
+
+        Lines that don't parse (e.g. a write cut short by a crash) are skipped
+        with a warning instead of failing the whole day. The parsed list is
+        cached until the file's mtime or size changes, so callers must treat it
+        as read-only.
+        """
+        # Make buffered entries visible to the read
+        self.flush()
+
+        log_file = self.log_dir / f"trades_{date}.jsonl"
+
+        if not log_file.exists():
+            return []
+
+        with open(log_file, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_size == 0:
+                return []
+
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = self._day_cache.get(date)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+            raw = f.read()
+
+        data: list[dict[str, Any]] = []
+        for line_no, line in enumerate(raw.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                data.append(orjson.loads(line))
+            except orjson.JSONDecodeError as e:
+                logger.warning(
+                    "Skipping unreadable trade log line",
+                    file=str(log_file),
+                    line=line_no,
+                    error=str(e),
+                )
+
+        with self._day_cache_lock:
+            self._day_cache[date] = (stamp, data)
+            while len(self._day_cache) > MAX_CACHED_DAYS:
+                del self._day_cache[next(iter(self._day_cache))]
+
+        return data
+
     def get_trades_for_date(self, date: str) -> list[TradeLogEntry]:
         """
         Get all trades for a specific date.
@@ -166,19 +484,21 @@ class TradeLogger:
         Returns:
             List of trade log entries
         """
-        log_file = self.log_dir / f"trades_{date}.jsonl"
+        return [TradeLogEntry(*values) for values in map(_entry_values, self._load_day(date))]
 
-        if not log_file.exists():
-            return []
+    def get_trade_rows_for_date(self, date: str) -> list[TradeLogRow]:
+        """
+        Get all trades for a specific date as read-only tuples.
 
-        entries = []
-        with open(log_file, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line)
-                    entries.append(TradeLogEntry(**data))
+        Cheaper than get_trades_for_date() when the caller only reads fields.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
 
-        return entries
+        Returns:
+            List of TradeLogRow tuples
+        """
+        return list(map(TradeLogRow._make, map(_entry_values, self._load_day(date))))
 
 
 class PerformanceTracker:
@@ -207,7 +527,7 @@ class PerformanceTracker:
         Returns:
             Summary dict with metrics
         """
-        trades = self.trade_logger.get_trades_for_date(date)
+        trades = self.trade_logger.get_trade_rows_for_date(date)
 
         if not trades:
             return {
@@ -221,43 +541,29 @@ class PerformanceTracker:
                 "losing_trades": 0,
             }
 
-        executed = [t for t in trades if t.status == "executed"]
-        rejected = [t for t in trades if t.status == "rejected"]
-        dry_runs = [t for t in trades if t.status == "dry_run"]
+        status_counts = Counter(t.status for t in trades)
+        executed_pnl = [t.pnl for t in trades if t.status == "executed"]
 
+        executed = status_counts["executed"]
+        winning = sum(pnl > 0 for pnl in executed_pnl)
+        losing = sum(pnl < 0 for pnl in executed_pnl)
         total_pnl = sum(t.pnl for t in trades)
-        winning = [t for t in executed if t.pnl > 0]
-        losing = [t for t in executed if t.pnl < 0]
 
         return {
             "date": date,
             "total_trades": len(trades),
-            "executed": len(executed),
-            "rejected": len(rejected),
-            "dry_runs": len(dry_runs),
+            "executed": executed,
+            "rejected": status_counts["rejected"],
+            "dry_runs": status_counts["dry_run"],
             "total_pnl": total_pnl,
             "total_pnl_dollars": total_pnl / 100,
-            "winning_trades": len(winning),
-            "losing_trades": len(losing),
-            "win_rate": len(winning) / len(executed) if executed else 0,
-            "by_sport": self._group_by_sport(trades),
-            "by_strategy": self._group_by_strategy(trades),
+            "winning_trades": winning,
+            "losing_trades": losing,
+            "win_rate": winning / executed if executed else 0,
+            "by_sport": dict(Counter(t.sport for t in trades)),
+            "by_strategy": dict(Counter(t.strategy_name for t in trades)),
         }
 
-    def _group_by_sport(self, trades: list[TradeLogEntry]) -> dict[str, int]:
-        """Group trade count by sport."""
-        counts: dict[str, int] = {}
-        for trade in trades:
-            counts[trade.sport] = counts.get(trade.sport, 0) + 1
-        return counts
-
-    def _group_by_strategy(self, trades: list[TradeLogEntry]) -> dict[str, int]:
-        """Group trade count by strategy."""
-        counts: dict[str, int] = {}
-        for trade in trades:
-            counts[trade.strategy_name] = counts.get(trade.strategy_name, 0) + 1
-        return counts
-
     def get_period_summary(self, start_date: str, end_date: str) -> dict[str, Any]:
         """
         Get summary for a date range.
@@ -269,26 +575,30 @@ class PerformanceTracker:
         Returns:
             Aggregated summary
         """
-        from datetime import datetime, timedelta
-
         start = datetime.strptime(start_date, "%Y-%m-%d")
         end = datetime.strptime(end_date, "%Y-%m-%d")
 
-        all_trades: list[TradeLogEntry] = []
-        current = start
+        dates = [
+            (start + timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range((end - start).days + 1)
+        ]
 
-        while current <= end:
-            date_str = current.strftime("%Y-%m-%d")
-            all_trades.extend(self.trade_logger.get_trades_for_date(date_str))
-            current += timedelta(days=1)
+        # Day files are independent, so read them concurrently (I/O bound)
+        workers = max(1, min(MAX_READ_WORKERS, len(dates)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            per_day = list(pool.map(self.trade_logger.get_trade_rows_for_date, dates))
 
-        executed = [t for t in all_trades if t.status == "executed"]
+        total_trades = executed = total_pnl = 0
+        for trades in per_day:
+            total_trades += len(trades)
+            executed += sum(t.status == "executed" for t in trades)
+            total_pnl += sum(t.pnl for t in trades)
 
         return {
             "start_date": start_date,
             "end_date": end_date,
-            "total_trades": len(all_trades),
-            "executed": len(executed),
-            "total_pnl": sum(t.pnl for t in all_trades),
-            "total_pnl_dollars": sum(t.pnl for t in all_trades) / 100,
+            "total_trades": total_trades,
+            "executed": executed,
+            "total_pnl": total_pnl,
+            "total_pnl_dollars": total_pnl / 100,
         }
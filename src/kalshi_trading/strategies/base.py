@@ -1,13 +1,14 @@
 """Base trading strategy interface and signal models."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
 from kalshi_trading.clients.espn import GameState
-from kalshi_trading.clients.models import Market, Position
+from kalshi_trading.clients.models import Market, MarketStatus, Position
 
 
 class Signal(Enum):
@@ -18,7 +19,7 @@ class Signal(Enum):
     HOLD = "hold"
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeSignal:
     """
     A trading signal generated by a strategy.
@@ -40,7 +41,7 @@ class TradeSignal:
         return self.signal != Signal.HOLD
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketState:
     """
     Current state of a Kalshi market.
@@ -78,7 +79,8 @@ class MarketState:
     @property
     def is_open(self) -> bool:
         """Check if market is open for trading."""
-        return self.market.status.value == "open"
+        # Market validates status into a MarketStatus member, so compare identity
+        return self.market.status is MarketStatus.OPEN
 
 
 class TradingStrategy(ABC):
@@ -103,6 +105,14 @@ class TradingStrategy(ABC):
                 return None
     """
 
+    __slots__ = ("name", "config")
+
+    # Relative cost of one evaluate() call; composites run cheaper strategies first
+    EVAL_COST: int = 5
+
+    # False for pure filters whose evaluate() never returns a signal
+    PRODUCES_SIGNALS: bool = True
+
     def __init__(self, name: str, config: dict[str, Any] | None = None):
         """
         Initialize strategy.
@@ -134,6 +144,11 @@ class TradingStrategy(ABC):
         """
         Evaluate current state and generate a trade signal.
 
+        Strategies only trade live games in open markets, so implementations
+        should return None unless game_state.is_live and market_state.is_open.
+        Composite strategies check that once and call evaluate_live() on their
+        sub-strategies instead.
+
         Args:
             game_state: Current game state from ESPN
             market_state: Current market state from Kalshi
@@ -144,6 +159,64 @@ class TradingStrategy(ABC):
         """
         pass
 
+    def evaluate_live(
+        self,
+        game_state: GameState,
+        market_state: MarketState,
+        position: Position | None,
+    ) -> TradeSignal | None:
+        """
+        Evaluate a game the caller has already checked is live in an open market.
+
+        Strategies that gate on is_live/is_open in evaluate() override this
+        with the ungated body. The default just calls evaluate().
+
+        Args:
+            game_state: Current game state from ESPN (live)
+            market_state: Current market state from Kalshi (open)
+            position: Current position in this market (None if no position)
+
+        Returns:
+            TradeSignal if action should be taken, None otherwise
+        """
+        return self.evaluate(game_state, market_state, position)
+
+    def is_allowed(self, game_state: GameState) -> bool:
+        """
+        Check whether this strategy permits trading in the current game state.
+
+        Filter strategies override this, and signal producers may too. Under
+        AND, composites check every override before running any producer and
+        reject when one disallows; under OR they skip a disallowing producer.
+        The default allows everything.
+
+        Args:
+            game_state: Current game state (live)
+
+        Returns:
+            True if trading is allowed
+        """
+        return True
+
+    def evaluate_batch(
+        self, margins: Sequence[int], statuses: Sequence[str]
+    ) -> list[bool] | None:
+        """
+        Pre-filter a run of snapshots using only their margin and status columns.
+
+        Lets the backtester skip building game and market state for rows that
+        can't trigger. Strategies without a cheap column-wise test return None,
+        meaning every row must go through evaluate().
+
+        Args:
+            margins: Home score minus away score per snapshot
+            statuses: Game status value ("pre", "in", "post") per snapshot
+
+        Returns:
+            Per-row flags (False = cannot trigger), or None for no pre-filter
+        """
+        return None
+
     def should_exit(
         self,
         game_state: GameState,
@@ -1,12 +1,18 @@
 """Score-based trading strategies."""
 
+import sys
+from collections.abc import Sequence
 from typing import Any
 
-from kalshi_trading.clients.espn import GameState
+from kalshi_trading.clients.espn import GameState, GameStatus
 from kalshi_trading.clients.models import Position
 
 from .base import MarketState, Signal, TradeSignal, TradingStrategy
 
+# Interned so cached config values can be compared by identity on the hot path
+_YES = sys.intern("yes")
+_NO = sys.intern("no")
+
 
 class ScoreMarginStrategy(TradingStrategy):
     """
@@ -23,8 +29,20 @@ class ScoreMarginStrategy(TradingStrategy):
         limit_offset: Cents to add to current price for limit order (default: 2)
     """
 
+    __slots__ = (
+        "_min_margin",
+        "_direction",
+        "_sign",
+        "_side",
+        "_size",
+        "_limit_offset",
+        "_reason_suffix",
+    )
+
+    EVAL_COST = 5
+
     def _validate_config(self) -> None:
-        """Validate required configuration."""
+        """Validate required configuration and cache it for evaluate()."""
         if "min_margin" not in self.config:
             raise ValueError("ScoreMarginStrategy requires 'min_margin' config")
 
@@ -36,6 +54,28 @@ class ScoreMarginStrategy(TradingStrategy):
         if direction not in ("leading", "trailing"):
             raise ValueError("direction must be 'leading' or 'trailing'")
 
+        side = self.config.get("side", _YES)
+        if isinstance(side, bool):
+            # YAML 1.1 reads a bare `side: yes` / `side: no` as a boolean
+            side = _YES if side else _NO
+        if side not in (_YES, _NO):
+            raise ValueError("side must be 'yes' or 'no'")
+
+        # Read once here instead of on every tick. Strings from parsed config are
+        # fresh objects, so intern them to make later comparisons pointer checks.
+        self._min_margin: int = min_margin
+        self._direction: str = sys.intern(direction)
+        # +1 when tracking the home lead, -1 when tracking its deficit
+        self._sign: int = 1 if direction == "leading" else -1
+        self._side: str = sys.intern(side)
+        self._size: int = self.config.get("size", 10)
+        self._limit_offset: int = self.config.get("limit_offset", 2)
+
+        # Only the margin varies per signal; the rest of the reason is fixed
+        self._reason_suffix: str = (
+            f" exceeds threshold {min_margin} ({self._direction})"
+        )
+
     def evaluate(
         self,
         game_state: GameState,
@@ -51,55 +91,60 @@ class ScoreMarginStrategy(TradingStrategy):
         - Point margin meets threshold
         - Direction matches (leading/trailing)
         """
-        # Only trade during live games
-        if not game_state.is_live:
+        # Only trade during live games in open markets
+        if not (game_state.is_live and market_state.is_open):
             return None
 
-        # Only trade in open markets
-        if not market_state.is_open:
-            return None
+        return self.evaluate_live(game_state, market_state, position)
 
-        # Get config values
-        min_margin = self.config["min_margin"]
-        direction = self.config.get("direction", "leading")
-        side = self.config.get("side", "yes")
-        size = self.config.get("size", 10)
-        limit_offset = self.config.get("limit_offset", 2)
-
-        # Calculate margin (positive = home leading)
-        margin = abs(game_state.margin)
-
-        # Check if margin threshold met
-        if margin < min_margin:
+    def evaluate_live(
+        self,
+        game_state: GameState,
+        market_state: MarketState,
+        position: Position | None,
+    ) -> TradeSignal | None:
+        """Check margin and direction for a live game in an open market."""
+        # Margin in the configured direction (positive = home leading).
+        # For simplicity, assume we're tracking the home team.
+        # One compare covers both the threshold and the direction check.
+        margin = game_state.margin * self._sign
+        if margin < self._min_margin:
             return None
 
-        # Check direction
-        home_leading = game_state.margin > 0
-
-        if direction == "leading":
-            # We want the favored team to be leading
-            # For simplicity, assume we're tracking the home team
-            if not home_leading:
-                return None
-        else:  # trailing
-            if home_leading:
-                return None
-
         # Calculate limit price
-        if side == "yes":
-            price = market_state.yes_ask + limit_offset
+        if self._side is _YES:
+            price = market_state.yes_ask + self._limit_offset
         else:
-            price = market_state.no_ask + limit_offset
+            price = market_state.no_ask + self._limit_offset
 
         return TradeSignal(
             signal=Signal.BUY,
             ticker=market_state.ticker,
-            side=side,
-            size=size,
+            side=self._side,
+            size=self._size,
             price=price,
-            reason=f"Margin {margin} exceeds threshold {min_margin} ({direction})",
+            reason=f"Margin {margin}{self._reason_suffix}",
         )
 
+    def evaluate_batch(
+        self, margins: Sequence[int], statuses: Sequence[str]
+    ) -> list[bool]:
+        """Flag the live snapshots whose directed margin meets the threshold."""
+        live = GameStatus.IN.value
+        # One specialized loop per direction avoids a multiply per row, and the
+        # margin test runs first since it rejects more rows than the status test
+        if self._sign > 0:
+            threshold = self._min_margin
+            return [
+                margin >= threshold and status == live
+                for margin, status in zip(margins, statuses, strict=True)
+            ]
+        threshold = -self._min_margin
+        return [
+            margin <= threshold and status == live
+            for margin, status in zip(margins, statuses, strict=True)
+        ]
+
 
 class GameTimeStrategy(TradingStrategy):
     """
@@ -113,8 +158,13 @@ class GameTimeStrategy(TradingStrategy):
         max_clock: Maximum seconds remaining in period (optional)
     """
 
+    __slots__ = ("_min_period", "_max_clock")
+
+    EVAL_COST = 1
+    PRODUCES_SIGNALS = False
+
     def _validate_config(self) -> None:
-        """Validate required configuration."""
+        """Validate required configuration and cache it for is_time_valid()."""
         if "min_period" not in self.config:
             raise ValueError("GameTimeStrategy requires 'min_period' config")
 
@@ -122,6 +172,9 @@ class GameTimeStrategy(TradingStrategy):
         if not isinstance(min_period, int) or min_period < 1:
             raise ValueError("min_period must be a positive integer")
 
+        self._min_period: int = min_period
+        self._max_clock: float | None = self.config.get("max_clock")
+
     def evaluate(
         self,
         game_state: GameState,
@@ -135,9 +188,13 @@ class GameTimeStrategy(TradingStrategy):
         used as a filter in composite strategies.
         """
         # This is a filter strategy - it doesn't generate signals
-        # but can be checked via is_time_valid()
+        # but can be checked via is_allowed() / is_time_valid()
         return None
 
+    def is_allowed(self, game_state: GameState) -> bool:
+        """Allow trading only inside the configured time window."""
+        return self.is_time_valid(game_state)
+
     def is_time_valid(self, game_state: GameState) -> bool:
         """
         Check if current game time meets criteria.
@@ -151,21 +208,23 @@ class GameTimeStrategy(TradingStrategy):
         if not game_state.is_live:
             return False
 
-        min_period = self.config["min_period"]
-        max_clock = self.config.get("max_clock")
-
         # Check period
-        if game_state.period < min_period:
+        if game_state.period < self._min_period:
             return False
 
         # Check clock if specified
-        if max_clock is not None:
-            if game_state.clock_seconds > max_clock:
+        if self._max_clock is not None:
+            if game_state.clock_seconds > self._max_clock:
                 return False
 
         return True
 
 
+def _overrides_is_allowed(strategy: TradingStrategy) -> bool:
+    """Check whether a strategy restricts trading through is_allowed()."""
+    return type(strategy).is_allowed is not TradingStrategy.is_allowed
+
+
 class CompositeStrategy(TradingStrategy):
     """
     Strategy that combines multiple sub-strategies.
@@ -175,8 +234,23 @@ class CompositeStrategy(TradingStrategy):
     Config:
         operator: "and" or "or" (default: "and")
         strategies: List of strategy configs
+
+    Sub-strategies should be added via add_strategy() so the evaluation
+    order stays current.
     """
 
+    __slots__ = (
+        "strategies",
+        "operator",
+        "_and_mode",
+        "_filters",
+        "_producers",
+        "_producer_gates",
+        "_producers_by_cost",
+    )
+
+    EVAL_COST = 10
+
     def __init__(
         self,
         name: str,
@@ -194,6 +268,8 @@ class CompositeStrategy(TradingStrategy):
         super().__init__(name, config)
         self.strategies = strategies or []
         self.operator = self.config.get("operator", "and")
+        self._and_mode = self.operator == "and"
+        self._partition_strategies()
 
     def _validate_config(self) -> None:
         """Validate configuration."""
@@ -204,6 +280,62 @@ class CompositeStrategy(TradingStrategy):
     def add_strategy(self, strategy: TradingStrategy) -> None:
         """Add a sub-strategy."""
         self.strategies.append(strategy)
+        self._partition_strategies()
+
+    def _partition_strategies(self) -> None:
+        """
+        Split sub-strategies into filters and signal producers.
+
+        Filters are strategies that override is_allowed(), whether or not they
+        also produce signals; they are the cheapest checks, so under AND they
+        all run first. Under OR a disallowing strategy is only skipped, so each
+        producer keeps its is_allowed gate (None when not overridden).
+
+        Producers keep their listed order, which decides whose signal is
+        returned; a copy ordered by EVAL_COST (stable, so equal costs keep
+        insertion order) and tagged with each producer's listed position lets
+        AND reject on the cheap ones before building signals in the expensive
+        ones.
+        """
+        self._filters = sorted(
+            (s for s in self.strategies if _overrides_is_allowed(s)),
+            key=lambda s: s.EVAL_COST,
+        )
+        self._producers = [s for s in self.strategies if s.PRODUCES_SIGNALS]
+        self._producer_gates = [
+            s.is_allowed if _overrides_is_allowed(s) else None for s in self._producers
+        ]
+        self._producers_by_cost = sorted(
+            enumerate(self._producers),
+            key=lambda ranked: ranked[1].EVAL_COST,
+        )
+
+    def evaluate_batch(
+        self, margins: Sequence[int], statuses: Sequence[str]
+    ) -> list[bool] | None:
+        """
+        Combine the producers' pre-filters into one mask.
+
+        Filters can only narrow the result, so they are left to evaluate().
+        Under AND a row is out if any producer rules it out; under OR every
+        producer needs a mask, otherwise all rows must be evaluated.
+        """
+        if not self._producers:
+            # Nothing here can produce a signal
+            return [False] * len(margins)
+
+        masks = [
+            strategy.evaluate_batch(margins, statuses) for strategy in self._producers
+        ]
+        if self._and_mode:
+            known = [mask for mask in masks if mask is not None]
+            if not known:
+                return None
+            return [all(flags) for flags in zip(*known, strict=True)]
+
+        if None in masks:
+            return None
+        return [any(flags) for flags in zip(*masks, strict=True)]
 
     def evaluate(
         self,
@@ -214,35 +346,58 @@ class CompositeStrategy(TradingStrategy):
         """
         Evaluate all sub-strategies based on operator.
 
-        For AND: All strategies must return a signal
-        For OR: Any strategy returning a signal triggers
+        For AND: All strategies must allow the game state and all producers
+        must return a signal
+        For OR: Any allowed strategy returning a signal triggers
+
+        Returns the signal of the earliest-listed sub-strategy that signals.
+        AND runs sub-strategies cheapest first and stops at the first that
+        fails; OR runs them in listed order and stops at the first signal.
 
-        Returns the first non-None signal found.
+        The live-game/open-market gate is checked once here rather than
+        by every sub-strategy.
         """
-        if not self.strategies:
+        if not (game_state.is_live and market_state.is_open):
             return None
 
-        signals: list[TradeSignal] = []
+        return self.evaluate_live(game_state, market_state, position)
+
+    def evaluate_live(
+        self,
+        game_state: GameState,
+        market_state: MarketState,
+        position: Position | None,
+    ) -> TradeSignal | None:
+        """Combine sub-strategy results for a live game in an open market."""
+        if self._and_mode:
+            # Under AND any strategy that disallows the game state rejects
+            for strategy_filter in self._filters:
+                if not strategy_filter.is_allowed(game_state):
+                    return None
+
+            first_rank = len(self._producers)
+            first_signal: TradeSignal | None = None
 
-        for strategy in self.strategies:
-            # Handle GameTimeStrategy specially
-            if isinstance(strategy, GameTimeStrategy):
-                if not strategy.is_time_valid(game_state):
-                    if self.operator == "and":
-                        return None  # AND fails if any condition fails
-                    continue
-                continue  # Time strategy doesn't produce signals
+            for rank, strategy in self._producers_by_cost:
+                signal = strategy.evaluate_live(game_state, market_state, position)
 
-            signal = strategy.evaluate(game_state, market_state, position)
+                if signal is None:
+                    # AND requires all strategies to signal
+                    return None
+                if rank < first_rank:
+                    first_rank, first_signal = rank, signal
 
-            if signal is not None:
-                signals.append(signal)
-            elif self.operator == "and":
-                # AND requires all strategies to signal
-                return None
+            return first_signal
 
-        if signals:
-            # Return the first signal (could enhance to merge signals)
-            return signals[0]
+        for strategy, gate in zip(self._producers, self._producer_gates, strict=True):
+            if gate is not None and not gate(game_state):
+                # Under OR a disallowed strategy is skipped, not fatal
+                continue
+
+            signal = strategy.evaluate_live(game_state, market_state, position)
+
+            if signal is not None:
+                # The earliest-listed signal wins - skip the remaining strategies
+                return signal
 
         return None
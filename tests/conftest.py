@@ -1,16 +1,49 @@
 """Shared test fixtures and configuration."""
 
-import pytest
+import sqlite3
+from collections.abc import Callable, Iterator
 from datetime import datetime
-from unittest.mock import AsyncMock
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import httpx
+import pytest
+
+from kalshi_trading.clients.espn import GameState, GameStatus, Team
+from kalshi_trading.clients.models import Market, MarketStatus
+from kalshi_trading.engine.risk import RiskLimits, RiskManager
+from kalshi_trading.monitoring.database import TradingDatabase
+from kalshi_trading.strategies import MarketState, Signal, TradeSignal
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only proxies and lists in tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Undo _freeze so a payload can be JSON encoded."""
+    if isinstance(value, (MappingProxyType, dict)):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (tuple, list)):
+        return [_thaw(v) for v in value]
+    return value
+
 
 # -- Sample Data Fixtures --
+# Built once per session and frozen so no test can mutate the shared copy.
+# Tests that need to modify the data should build their own dict.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_espn_scoreboard():
     """Sample ESPN scoreboard response for NFL."""
-    return {
+    return _freeze({
         "events": [
             {
                 "id": "401547417",
@@ -58,13 +91,13 @@ def sample_espn_scoreboard():
                 ],
             }
         ]
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_espn_nba_scoreboard():
     """Sample ESPN scoreboard response for NBA."""
-    return {
+    return _freeze({
         "events": [
             {
                 "id": "401584922",
@@ -112,13 +145,13 @@ def sample_espn_nba_scoreboard():
                 ],
             }
         ]
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_kalshi_markets():
     """Sample Kalshi markets response."""
-    return {
+    return _freeze({
         "markets": [
             {
                 "ticker": "NFL-2426-BUF",
@@ -134,13 +167,13 @@ def sample_kalshi_markets():
             }
         ],
         "cursor": None,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_kalshi_order():
     """Sample Kalshi order response."""
-    return {
+    return _freeze({
         "order_id": "ord_abc123",
         "ticker": "NFL-2426-BUF",
         "status": "pending",
@@ -151,37 +184,150 @@ def sample_kalshi_order():
         "remaining_count": 10,
         "price": 64,
         "created_time": "2026-01-08T20:15:00Z",
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_kalshi_position():
     """Sample Kalshi position response."""
-    return {
+    return _freeze({
         "ticker": "NFL-2426-BUF",
         "market_exposure": 640,
         "position": 10,
         "realized_pnl": 0,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_kalshi_balance():
     """Sample Kalshi balance response."""
-    return {
+    return _freeze({
         "balance": 10000,  # $100.00 in cents
         "payout": 0,
-    }
+    })
 
 
 # -- Mock Client Fixtures --
 
 
+@pytest.fixture(scope="session")
+def api_response() -> Callable[..., httpx.Response]:
+    """Build an httpx.Response for a respx route from a sample payload."""
+
+    def build(payload: Any, status_code: int = 200) -> httpx.Response:
+        return httpx.Response(status_code, json=_thaw(payload))
+
+    return build
+
+
+# -- Database Fixtures --
+
+
+@pytest.fixture(scope="session")
+def db_image() -> Iterator[sqlite3.Connection]:
+    """Initialize the schema once, in memory; test databases are restored from it."""
+    template = TradingDatabase(":memory:")
+    template.initialize()
+    yield template._connect()
+    template.close()
+
+
+@pytest.fixture
+def db(db_image: sqlite3.Connection) -> Iterator[TradingDatabase]:
+    """Create an in-memory test database (a copy of the initialized image)."""
+    db = TradingDatabase(":memory:")
+    db_image.backup(db._connect())
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def file_db(db_image: sqlite3.Connection, tmp_path: Path) -> Iterator[TradingDatabase]:
+    """Create an on-disk test database, for tests that close and reopen it."""
+    path = tmp_path / "test.db"
+    target = sqlite3.connect(path)
+    db_image.backup(target)
+    target.close()
+    db = TradingDatabase(path)
+    yield db
+    db.close()
+
+
+# -- Domain Fixtures --
+# Shared by the unit tests and the benchmarks in tests/perf. Built once per
+# session: Team and GameState are frozen, and no test modifies the market
+# (tests needing another status use model_copy).
+
+
+@pytest.fixture(scope="session")
+def home_team() -> Team:
+    return Team(id="1", abbreviation="BUF", display_name="Buffalo Bills")
+
+
+@pytest.fixture(scope="session")
+def away_team() -> Team:
+    return Team(id="2", abbreviation="KC", display_name="Kansas City Chiefs")
+
+
+@pytest.fixture(scope="session")
+def live_game(home_team: Team, away_team: Team) -> GameState:
+    """Game in progress with home team leading."""
+    return GameState(
+        event_id="12345",
+        sport="nfl",
+        home_team=home_team,
+        away_team=away_team,
+        home_score=21,
+        away_score=14,
+        period=4,
+        clock_seconds=300.0,  # 5 minutes left
+        status=GameStatus.IN,
+    )
+
+
+@pytest.fixture(scope="session")
+def open_market() -> MarketState:
+    """Open market for testing."""
+    market = Market(
+        ticker="NFL-2426-BUF",
+        event_ticker="NFL-2426",
+        title="Will the Buffalo Bills win?",
+        status=MarketStatus.OPEN,
+        yes_bid=62,
+        yes_ask=64,
+        no_bid=36,
+        no_ask=38,
+        volume=15420,
+        open_interest=8234,
+    )
+    return MarketState(market=market)
+
+
+@pytest.fixture(scope="session")
+def risk_limits() -> RiskLimits:
+    """Risk limits shared by every test; tests must not modify them."""
+    return RiskLimits(
+        max_position_size=100,
+        max_daily_loss=50000,  # $500
+        max_exposure_per_market=20000,  # $200
+        max_total_exposure=100000,  # $1000
+    )
+
+
+@pytest.fixture
+def risk_manager(risk_limits: RiskLimits) -> RiskManager:
+    """Create a risk manager with fresh state over the shared limits."""
+    return RiskManager(risk_limits)
+
+
 @pytest.fixture
-def mock_httpx_client():
-    """Mock httpx async client."""
-    client = AsyncMock()
-    client.get = AsyncMock()
-    client.post = AsyncMock()
-    client.delete = AsyncMock()
-    return client
+def buy_signal() -> TradeSignal:
+    """Create a sample buy signal."""
+    return TradeSignal(
+        signal=Signal.BUY,
+        ticker="NFL-2426-BUF",
+        side="yes",
+        size=10,
+        price=64,  # 64 cents
+        reason="Test signal",
+    )
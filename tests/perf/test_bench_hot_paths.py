@@ -0,0 +1,45 @@
+"""Microbenchmarks for per-quote hot paths.
+
+These need pytest-benchmark (dev extras) and are skipped without it, or when
+the run wasn't started with --benchmark-only. Each benchmark also fails if its
+mean exceeds a pinned ceiling, so a large slowdown can't land silently.
+
+Run with: pytest tests/perf --benchmark-only
+Compare against a saved baseline with:
+    pytest tests/perf --benchmark-only --benchmark-compare --benchmark-compare-fail=mean:25%
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from kalshi_trading.clients.espn import GameState  # noqa: E402
+from kalshi_trading.engine.risk import RiskManager  # noqa: E402
+from kalshi_trading.strategies import (  # noqa: E402
+    MarketState,
+    ScoreMarginStrategy,
+    TradeSignal,
+)
+
+pytestmark = pytest.mark.slow
+
+# Mean-time ceilings in seconds, roughly 10x the times measured on a dev laptop
+# (~1.3 us and ~1.7 us) to leave room for slower CI machines
+CAN_TRADE_MAX_MEAN = 15e-6
+EVALUATE_MAX_MEAN = 20e-6
+
+
+def test_can_trade(benchmark, risk_manager: RiskManager, buy_signal: TradeSignal):
+    """RiskManager.can_trade for an allowed signal."""
+    assert benchmark(risk_manager.can_trade, buy_signal) is True
+    assert benchmark.stats.stats.mean < CAN_TRADE_MAX_MEAN
+
+
+def test_score_margin_evaluate(
+    benchmark, live_game: GameState, open_market: MarketState
+):
+    """ScoreMarginStrategy.evaluate for a snapshot that triggers."""
+    strategy = ScoreMarginStrategy(name="bench", config={"min_margin": 7})
+
+    assert benchmark(strategy.evaluate, live_game, open_market, None) is not None
+    assert benchmark.stats.stats.mean < EVALUATE_MAX_MEAN
@@ -1,24 +1,14 @@
 """Unit tests for backtesting framework."""
 
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
-from kalshi_trading.clients.espn import GameState, GameStatus, Team
 from kalshi_trading.engine.backtester import Backtester, BacktestResult, BacktestTrade
 from kalshi_trading.monitoring.database import TradingDatabase
 from kalshi_trading.strategies import ScoreMarginStrategy
 
 
-@pytest.fixture
-def db(tmp_path: Path) -> TradingDatabase:
-    """Create test database with sample data."""
-    db = TradingDatabase(tmp_path / "test.db")
-    db.initialize()
-    return db
-
-
 @pytest.fixture
 def sample_strategy() -> ScoreMarginStrategy:
     """Create sample strategy for testing."""
@@ -32,38 +22,26 @@ def sample_strategy() -> ScoreMarginStrategy:
 def populated_db(db: TradingDatabase) -> TradingDatabase:
     """Database with sample game state snapshots."""
     # Simulate a game progressing
+    game = {"event_id": "123", "sport": "nfl", "home_team": "BUF", "away_team": "KC"}
     snapshots = [
         # Q1 - Close game
-        {"event_id": "123", "sport": "nfl", "home_team": "BUF", "away_team": "KC",
-         "home_score": 7, "away_score": 7, "period": 1, "clock_seconds": 600, "status": "in"},
+        {**game, "timestamp": "2026-01-08T20:00:00", "home_score": 7, "away_score": 7,
+         "period": 1, "clock_seconds": 600, "status": "in"},
         # Q2 - Home starts leading
-        {"event_id": "123", "sport": "nfl", "home_team": "BUF", "away_team": "KC",
-         "home_score": 14, "away_score": 7, "period": 2, "clock_seconds": 300, "status": "in"},
+        {**game, "timestamp": "2026-01-08T20:30:00", "home_score": 14, "away_score": 7,
+         "period": 2, "clock_seconds": 300, "status": "in"},
         # Q3 - Home extends lead
-        {"event_id": "123", "sport": "nfl", "home_team": "BUF", "away_team": "KC",
-         "home_score": 21, "away_score": 7, "period": 3, "clock_seconds": 600, "status": "in"},
+        {**game, "timestamp": "2026-01-08T21:00:00", "home_score": 21, "away_score": 7,
+         "period": 3, "clock_seconds": 600, "status": "in"},
         # Q4 - Home maintains lead (triggers strategy at 14pt margin)
-        {"event_id": "123", "sport": "nfl", "home_team": "BUF", "away_team": "KC",
-         "home_score": 28, "away_score": 14, "period": 4, "clock_seconds": 300, "status": "in"},
+        {**game, "timestamp": "2026-01-08T21:30:00", "home_score": 28, "away_score": 14,
+         "period": 4, "clock_seconds": 300, "status": "in"},
         # Final - Home wins
-        {"event_id": "123", "sport": "nfl", "home_team": "BUF", "away_team": "KC",
-         "home_score": 31, "away_score": 21, "period": 4, "clock_seconds": 0, "status": "post"},
+        {**game, "timestamp": "2026-01-08T22:00:00", "home_score": 31, "away_score": 21,
+         "period": 4, "clock_seconds": 0, "status": "post"},
     ]
 
-    for i, snap in enumerate(snapshots):
-        game = GameState(
-            event_id=snap["event_id"],
-            sport=snap["sport"],
-            home_team=Team(id="1", abbreviation=snap["home_team"], display_name=snap["home_team"]),
-            away_team=Team(id="2", abbreviation=snap["away_team"], display_name=snap["away_team"]),
-            home_score=snap["home_score"],
-            away_score=snap["away_score"],
-            period=snap["period"],
-            clock_seconds=snap["clock_seconds"],
-            status=GameStatus(snap["status"]),
-        )
-        db.insert_game_state(game)
-
+    db.insert_game_states_bulk(snapshots)
     return db
 
 
@@ -1,6 +1,8 @@
 """Unit tests for SQLite database."""
 
-from datetime import datetime
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
@@ -10,14 +12,6 @@ from kalshi_trading.monitoring import TradingDatabase
 from kalshi_trading.strategies.base import Signal, TradeSignal
 
 
-@pytest.fixture
-def db(tmp_path: Path) -> TradingDatabase:
-    """Create a test database."""
-    db = TradingDatabase(tmp_path / "test.db")
-    db.initialize()
-    return db
-
-
 @pytest.fixture
 def sample_signal() -> TradeSignal:
     """Create sample trade signal."""
@@ -70,6 +64,224 @@ class TestDatabaseInitialization:
         assert "signals" in tables
         assert "game_states" in tables
         assert "daily_summary" in tables
+        assert "strategy_summary" in tables
+
+    def test_grouped_analytics_use_covering_index(self, db: TradingDatabase):
+        """Grouped rollup queries should be answered from an index alone."""
+        from kalshi_trading.monitoring.database import _SQL_PERFORMANCE_BY_STRATEGY
+
+        with db._get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN " + _SQL_PERFORMANCE_BY_STRATEGY
+            ).fetchall()
+
+        assert any("COVERING INDEX" in row["detail"] for row in plan)
+
+
+class TestDateColumns:
+    """Tests for generated, indexed date columns."""
+
+    def test_trade_date_derived_from_timestamp(
+        self, db: TradingDatabase, sample_signal: TradeSignal
+    ):
+        """Should expose the trade's YYYY-MM-DD date as trade_date."""
+        db.insert_trade(
+            signal=sample_signal,
+            event_id="1",
+            sport="nfl",
+            matchup="KC@BUF",
+            strategy_name="nfl_spread",
+            status="executed",
+        )
+
+        trade = db.get_recent_trades(1)[0]
+
+        assert trade["trade_date"] == sample_signal.timestamp.strftime("%Y-%m-%d")
+
+    def test_initialize_adds_columns_to_legacy_tables(self, tmp_path: Path):
+        """Should add date columns to tables created before they existed."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE game_states (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                event_id TEXT NOT NULL,
+                sport TEXT NOT NULL,
+                home_team TEXT NOT NULL,
+                away_team TEXT NOT NULL,
+                home_score INTEGER NOT NULL,
+                away_score INTEGER NOT NULL,
+                period INTEGER NOT NULL,
+                clock_seconds REAL NOT NULL,
+                status TEXT NOT NULL,
+                margin INTEGER NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO game_states (timestamp, event_id, sport, home_team, away_team, "
+            "home_score, away_score, period, clock_seconds, status, margin) "
+            "VALUES ('2026-01-08T20:15:00', '1', 'nfl', 'BUF', 'KC', 7, 0, 1, 600, 'in', 7)"
+        )
+        conn.commit()
+        conn.close()
+
+        db = TradingDatabase(db_path)
+        db.initialize()
+
+        with db._get_connection() as conn:
+            row = conn.execute("SELECT snapshot_date FROM game_states").fetchone()
+
+        assert row["snapshot_date"] == "2026-01-08"
+
+
+class TestNameLookups:
+    """Tests for dictionary-encoded sport and strategy names."""
+
+    def test_names_stored_once(
+        self, db: TradingDatabase, sample_signal: TradeSignal
+    ):
+        """Should reuse one lookup row per name and decode it on read."""
+        for event_id in ("1", "2"):
+            db.insert_trade(
+                signal=sample_signal,
+                event_id=event_id,
+                sport="nfl",
+                matchup="KC@BUF",
+                strategy_name="nfl_spread",
+                status="executed",
+            )
+
+        with db._get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM sports").fetchone()[0] == 1
+            assert conn.execute("SELECT COUNT(*) FROM strategies").fetchone()[0] == 1
+
+        trade = db.get_recent_trades(1)[0]
+        assert trade["sport"] == "nfl"
+        assert trade["strategy_name"] == "nfl_spread"
+
+    def test_initialize_migrates_legacy_trades(self, tmp_path: Path):
+        """Should move name-keyed trades onto lookup ids and rebuild rollups."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            CREATE TABLE trades (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                event_id TEXT NOT NULL,
+                sport TEXT NOT NULL,
+                matchup TEXT NOT NULL,
+                ticker TEXT NOT NULL,
+                signal_type TEXT NOT NULL,
+                side TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                price INTEGER,
+                fill_price INTEGER,
+                status TEXT NOT NULL,
+                strategy_name TEXT NOT NULL,
+                reason TEXT,
+                pnl INTEGER DEFAULT 0,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE INDEX idx_trades_timestamp ON trades(timestamp);
+            INSERT INTO trades (
+                timestamp, event_id, sport, matchup, ticker, signal_type,
+                side, size, price, status, strategy_name, pnl
+            ) VALUES
+                ('2026-01-08T20:15:00', '1', 'nfl', 'KC@BUF', 'T1', 'buy',
+                 'yes', 10, 75, 'executed', 'nfl_spread', 50),
+                ('2026-01-08T21:15:00', '2', 'nba', 'LAL@BOS', 'T2', 'buy',
+                 'no', 5, 60, 'executed', 'nba_blowout', -20);
+            """
+        )
+        conn.close()
+
+        db = TradingDatabase(db_path)
+        db.initialize()
+
+        trades = db.get_recent_trades()
+        assert [t["strategy_name"] for t in trades] == ["nba_blowout", "nfl_spread"]
+        assert [t["id"] for t in trades] == [2, 1]
+
+        by_sport = db.get_performance_by_sport()
+        assert by_sport["nfl"]["total_pnl"] == 50
+        assert by_sport["nba"]["total_pnl"] == -20
+        assert db.get_strategy_performance()["total_trades"] == 2
+
+
+class TestConnectionReuse:
+    """Tests for the per-thread persistent connection."""
+
+    def test_reuses_connection_across_calls(self, db: TradingDatabase):
+        """Should hand out the same connection so cached statements survive."""
+        with db._get_connection() as first:
+            pass
+        with db._get_connection() as second:
+            pass
+
+        assert first is second
+
+    def test_close_reopens_on_next_use(self, file_db: TradingDatabase):
+        """Should open a fresh connection after close()."""
+        with file_db._get_connection() as first:
+            pass
+
+        file_db.close()
+
+        with file_db._get_connection() as second:
+            assert second is not first
+            assert second.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 0
+
+
+    def test_close_closes_connections_from_other_threads(self, file_db: TradingDatabase):
+        """close() should close every thread's connection, not just the caller's."""
+        opened: list[sqlite3.Connection] = []
+        worker = threading.Thread(target=lambda: opened.append(file_db._connect()))
+        worker.start()
+        worker.join()
+
+        file_db.close()
+
+        with pytest.raises(sqlite3.ProgrammingError, match="closed database"):
+            opened[0].execute("SELECT 1")
+
+    def test_lookup_ids_cached_per_connection(self, sample_signal: TradeSignal):
+        """Each thread's in-memory database should resolve names to its own ids."""
+        db = TradingDatabase(":memory:")
+        db.initialize()
+        db.insert_trade(
+            signal=sample_signal,
+            event_id="1",
+            sport="nfl",
+            matchup="KC@BUF",
+            strategy_name="nfl_spread",
+            status="executed",
+        )
+        other_sports: list[str] = []
+
+        def insert_on_other_thread() -> None:
+            db.initialize()
+            for sport in ("nba", "nfl"):
+                db.insert_trade(
+                    signal=sample_signal,
+                    event_id="2",
+                    sport=sport,
+                    matchup="LAL@BOS",
+                    strategy_name="nba_margin",
+                    status="executed",
+                )
+            other_sports.extend(trade["sport"] for trade in db.get_recent_trades(10))
+
+        worker = threading.Thread(target=insert_on_other_thread)
+        worker.start()
+        worker.join()
+        db.close()
+
+        assert sorted(other_sports) == ["nba", "nfl"]
 
 
 class TestTradeInsertion:
@@ -140,6 +352,46 @@ class TestGameStateInsertion:
         assert row_id > 0
 
 
+class TestBulkGameStateInsertion:
+    """Tests for batched game state inserts."""
+
+    def test_insert_game_states_shares_timestamp(
+        self, db: TradingDatabase, sample_game: GameState
+    ):
+        """Should insert every snapshot with the same timestamp."""
+        ids = db.insert_game_states(
+            [sample_game, sample_game], timestamp="2026-01-08T20:15:00"
+        )
+
+        with db._get_connection() as conn:
+            rows = conn.execute("SELECT id, timestamp FROM game_states ORDER BY id").fetchall()
+
+        assert ids == [row["id"] for row in rows]
+        assert [row["timestamp"] for row in rows] == ["2026-01-08T20:15:00"] * 2
+
+    def test_insert_game_states_bulk_from_dicts(self, db: TradingDatabase):
+        """Should insert raw rows and derive the margin from the scores."""
+        row = {"event_id": "1", "sport": "nfl", "home_team": "BUF", "away_team": "KC",
+               "home_score": 10, "away_score": 17, "period": 2,
+               "clock_seconds": 120.0, "status": "in"}
+
+        count = db.insert_game_states_bulk(
+            [row, {**row, "timestamp": "2026-01-09T20:00:00"}],
+            timestamp="2026-01-08T20:00:00",
+        )
+
+        with db._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT timestamp, margin FROM game_states ORDER BY id"
+            ).fetchall()
+
+        assert count == 2
+        assert [r["timestamp"] for r in rows] == [
+            "2026-01-08T20:00:00", "2026-01-09T20:00:00"
+        ]
+        assert [r["margin"] for r in rows] == [-7, -7]
+
+
 class TestStrategyPerformance:
     """Tests for performance analytics."""
 
@@ -268,6 +520,118 @@ class TestPerformanceBySport:
         assert by_sport["nba"]["total_pnl"] == 200
 
 
+class TestSummaryRollups:
+    """Tests for trigger-maintained summary tables."""
+
+    def test_daily_pnl_from_rollup(
+        self, db: TradingDatabase, sample_signal: TradeSignal
+    ):
+        """Should report executed trades and P&L per day."""
+        db.insert_trade(
+            signal=sample_signal,
+            event_id="1",
+            sport="nfl",
+            matchup="KC@BUF",
+            strategy_name="nfl_spread",
+            status="executed",
+            pnl=100,
+        )
+        db.insert_trade(
+            signal=sample_signal,
+            event_id="2",
+            sport="nfl",
+            matchup="DEN@LV",
+            strategy_name="nfl_spread",
+            status="dry_run",
+        )
+
+        daily = db.get_daily_pnl(days=1)
+
+        assert len(daily) == 1
+        assert daily[0]["date"] == sample_signal.timestamp.strftime("%Y-%m-%d")
+        assert daily[0]["trades"] == 1
+        assert daily[0]["pnl"] == 100
+
+    def test_daily_summary_counts_signals(
+        self, db: TradingDatabase, sample_signal: TradeSignal
+    ):
+        """Should count signals alongside trades in daily_summary."""
+        db.insert_signal(
+            signal=sample_signal,
+            event_id="1",
+            sport="nfl",
+            strategy_name="nfl_spread",
+        )
+        db.insert_trade(
+            signal=sample_signal,
+            event_id="1",
+            sport="nfl",
+            matchup="KC@BUF",
+            strategy_name="nfl_spread",
+            status="rejected",
+        )
+
+        with db._get_connection() as conn:
+            row = conn.execute("SELECT * FROM daily_summary").fetchone()
+
+        assert row["total_signals"] == 1
+        assert row["total_trades"] == 1
+        assert row["rejected_trades"] == 1
+
+    def test_daily_summary_buckets_tz_aware_signals_with_trades(
+        self, db: TradingDatabase, sample_signal: TradeSignal
+    ):
+        """Signals and trades should share a day even when date() would shift to UTC."""
+        late_evening = datetime(2026, 1, 8, 23, 30, tzinfo=timezone(timedelta(hours=-5)))
+        sample_signal.timestamp = late_evening
+        db.insert_signal(
+            signal=sample_signal,
+            event_id="1",
+            sport="nfl",
+            strategy_name="nfl_spread",
+        )
+        db.insert_trade(
+            signal=sample_signal,
+            event_id="1",
+            sport="nfl",
+            matchup="KC@BUF",
+            strategy_name="nfl_spread",
+            status="executed",
+        )
+
+        for _ in range(2):
+            with db._get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT date, total_signals, total_trades FROM daily_summary"
+                ).fetchall()
+            assert [tuple(row) for row in rows] == [("2026-01-08", 1, 1)]
+            db.rebuild_summaries()
+
+    def test_initialize_backfills_existing_trades(
+        self, db: TradingDatabase, sample_signal: TradeSignal
+    ):
+        """Should rebuild rollups for databases that predate the triggers."""
+        db.insert_trade(
+            signal=sample_signal,
+            event_id="1",
+            sport="nfl",
+            matchup="KC@BUF",
+            strategy_name="nfl_spread",
+            status="executed",
+            pnl=75,
+        )
+        with db._get_connection() as conn:
+            conn.execute("DELETE FROM strategy_summary")
+            conn.execute("DELETE FROM daily_summary")
+
+        db.initialize()
+
+        perf = db.get_strategy_performance("nfl_spread")
+        assert perf["total_trades"] == 1
+        assert perf["total_pnl"] == 75
+        assert db.get_daily_pnl(days=1)[0]["pnl"] == 75
+
+
 class TestRecentTrades:
     """Tests for recent trades query."""
 
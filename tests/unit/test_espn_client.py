@@ -1,8 +1,11 @@
 """Unit tests for ESPN API client."""
 
-from unittest.mock import AsyncMock, patch
+from collections.abc import Callable
+from dataclasses import FrozenInstanceError
 
+import httpx
 import pytest
+import respx
 
 from kalshi_trading.clients.espn import (
     ESPNClient,
@@ -15,9 +18,23 @@ from kalshi_trading.clients.espn import (
 
 
 @pytest.fixture
-def espn_client() -> ESPNClient:
-    """Create an ESPN client for testing."""
-    return ESPNClient()
+def espn_api() -> respx.MockRouter:
+    """Mocked ESPN API routes, relative to the client's base URL."""
+    return respx.MockRouter(base_url=ESPNClient.BASE_URL, assert_all_called=False)
+
+
+@pytest.fixture
+def espn_client(espn_api: respx.MockRouter) -> ESPNClient:
+    """Create an ESPN client whose requests are answered by espn_api."""
+    return ESPNClient(transport=httpx.MockTransport(espn_api.async_handler))
+
+
+@pytest.fixture(scope="module")
+def parsed_nfl_game(sample_espn_scoreboard: dict) -> GameState:
+    """Parse the sample NFL event once for the module; GameState is frozen."""
+    game = ESPNClient()._parse_game(sample_espn_scoreboard["events"][0], Sport.NFL)
+    assert game is not None
+    return game
 
 
 class TestESPNScoreboard:
@@ -25,136 +42,120 @@ class TestESPNScoreboard:
 
     @pytest.mark.asyncio
     async def test_get_nfl_scoreboard(
-        self, espn_client: ESPNClient, sample_espn_scoreboard: dict
+        self,
+        espn_client: ESPNClient,
+        espn_api: respx.MockRouter,
+        api_response: Callable[..., httpx.Response],
+        sample_espn_scoreboard: dict,
     ):
         """Should fetch and parse NFL scoreboard."""
-        with patch.object(
-            espn_client, "_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = sample_espn_scoreboard
+        route = espn_api.get("/football/nfl/scoreboard").mock(
+            return_value=api_response(sample_espn_scoreboard)
+        )
 
-            async with espn_client:
-                games = await espn_client.get_scoreboard(Sport.NFL)
+        async with espn_client:
+            games = await espn_client.get_scoreboard(Sport.NFL)
 
-            assert len(games) == 1
-            assert games[0].sport == "nfl"
-            mock_request.assert_called_once()
+        assert len(games) == 1
+        assert games[0].sport == "nfl"
+        assert route.call_count == 1
 
     @pytest.mark.asyncio
     async def test_get_nba_scoreboard(
-        self, espn_client: ESPNClient, sample_espn_nba_scoreboard: dict
+        self,
+        espn_client: ESPNClient,
+        espn_api: respx.MockRouter,
+        api_response: Callable[..., httpx.Response],
+        sample_espn_nba_scoreboard: dict,
     ):
         """Should fetch and parse NBA scoreboard."""
-        with patch.object(
-            espn_client, "_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = sample_espn_nba_scoreboard
+        espn_api.get("/basketball/nba/scoreboard").mock(
+            return_value=api_response(sample_espn_nba_scoreboard)
+        )
 
-            async with espn_client:
-                games = await espn_client.get_scoreboard(Sport.NBA)
+        async with espn_client:
+            games = await espn_client.get_scoreboard(Sport.NBA)
 
-            assert len(games) == 1
-            assert games[0].sport == "nba"
+        assert len(games) == 1
+        assert games[0].sport == "nba"
 
     @pytest.mark.asyncio
-    async def test_get_college_football_scoreboard(self, espn_client: ESPNClient):
+    async def test_get_college_football_scoreboard(
+        self, espn_client: ESPNClient, espn_api: respx.MockRouter
+    ):
         """Should fetch college football scoreboard with FBS filter."""
-        with patch.object(
-            espn_client, "_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = {"events": []}
+        route = espn_api.get("/football/college-football/scoreboard").respond(
+            json={"events": []}
+        )
 
-            async with espn_client:
-                await espn_client.get_scoreboard(Sport.COLLEGE_FOOTBALL)
+        async with espn_client:
+            await espn_client.get_scoreboard(Sport.COLLEGE_FOOTBALL)
 
-            # Verify FBS groups parameter
-            call_args = mock_request.call_args
-            assert call_args[1]["params"]["groups"] == "80"
+        # Verify FBS groups parameter
+        assert route.calls.last.request.url.params["groups"] == "80"
 
     @pytest.mark.asyncio
     async def test_scoreboard_with_date_filter(
-        self, espn_client: ESPNClient, sample_espn_scoreboard: dict
+        self,
+        espn_client: ESPNClient,
+        espn_api: respx.MockRouter,
+        api_response: Callable[..., httpx.Response],
+        sample_espn_scoreboard: dict,
     ):
         """Should accept date parameter."""
-        with patch.object(
-            espn_client, "_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = sample_espn_scoreboard
+        route = espn_api.get("/football/nfl/scoreboard").mock(
+            return_value=api_response(sample_espn_scoreboard)
+        )
 
-            async with espn_client:
-                await espn_client.get_scoreboard(Sport.NFL, date="20260108")
+        async with espn_client:
+            await espn_client.get_scoreboard(Sport.NFL, date="20260108")
 
-            call_args = mock_request.call_args
-            assert call_args[1]["params"]["dates"] == "20260108"
+        assert route.calls.last.request.url.params["dates"] == "20260108"
 
 
 class TestESPNGameParsing:
     """Tests for parsing game data."""
 
-    def test_parse_event_extracts_teams(
-        self, espn_client: ESPNClient, sample_espn_scoreboard: dict
-    ):
+    def test_parse_event_extracts_teams(self, parsed_nfl_game: GameState):
         """Should extract home and away teams."""
-        event = sample_espn_scoreboard["events"][0]
-        game = espn_client._parse_game(event, Sport.NFL)
+        game = parsed_nfl_game
 
-        assert game is not None
         assert game.home_team.abbreviation == "BUF"
         assert game.away_team.abbreviation == "KC"
 
-    def test_parse_event_extracts_scores(
-        self, espn_client: ESPNClient, sample_espn_scoreboard: dict
-    ):
+    def test_parse_event_extracts_scores(self, parsed_nfl_game: GameState):
         """Should extract current scores as integers."""
-        event = sample_espn_scoreboard["events"][0]
-        game = espn_client._parse_game(event, Sport.NFL)
+        game = parsed_nfl_game
 
-        assert game is not None
         assert game.home_score == 21
         assert game.away_score == 14
 
-    def test_parse_event_extracts_clock(
-        self, espn_client: ESPNClient, sample_espn_scoreboard: dict
-    ):
+    def test_parse_event_extracts_clock(self, parsed_nfl_game: GameState):
         """Should extract game clock in seconds."""
-        event = sample_espn_scoreboard["events"][0]
-        game = espn_client._parse_game(event, Sport.NFL)
+        game = parsed_nfl_game
 
-        assert game is not None
         assert game.clock_seconds == 423.0  # 7:03 in seconds
 
-    def test_parse_event_extracts_period(
-        self, espn_client: ESPNClient, sample_espn_scoreboard: dict
-    ):
+    def test_parse_event_extracts_period(self, parsed_nfl_game: GameState):
         """Should extract current period/quarter."""
-        event = sample_espn_scoreboard["events"][0]
-        game = espn_client._parse_game(event, Sport.NFL)
+        game = parsed_nfl_game
 
-        assert game is not None
         assert game.period == 3  # 3rd quarter
 
-    def test_parse_event_determines_status(
-        self, espn_client: ESPNClient, sample_espn_scoreboard: dict
-    ):
+    def test_parse_event_determines_status(self, parsed_nfl_game: GameState):
         """Should correctly identify in-progress status."""
-        event = sample_espn_scoreboard["events"][0]
-        game = espn_client._parse_game(event, Sport.NFL)
+        game = parsed_nfl_game
 
-        assert game is not None
         assert game.status == GameStatus.IN
 
 
 class TestESPNGameState:
     """Tests for GameState model."""
 
-    def test_margin_calculation_home_leading(
-        self, espn_client: ESPNClient, sample_espn_scoreboard: dict
-    ):
+    def test_margin_calculation_home_leading(self, parsed_nfl_game: GameState):
         """Margin should be positive when home team leads."""
-        event = sample_espn_scoreboard["events"][0]
-        game = espn_client._parse_game(event, Sport.NFL)
+        game = parsed_nfl_game
 
-        assert game is not None
         # Buffalo (home) 21, KC (away) 14 -> margin = 7
         assert game.margin == 7
 
@@ -174,14 +175,10 @@ class TestESPNGameState:
 
         assert game.margin == -7
 
-    def test_is_live_during_game(
-        self, espn_client: ESPNClient, sample_espn_scoreboard: dict
-    ):
+    def test_is_live_during_game(self, parsed_nfl_game: GameState):
         """is_live should be True during active game."""
-        event = sample_espn_scoreboard["events"][0]
-        game = espn_client._parse_game(event, Sport.NFL)
+        game = parsed_nfl_game
 
-        assert game is not None
         assert game.is_live is True
 
     def test_is_live_false_before_game(self):
@@ -216,53 +213,85 @@ class TestESPNGameState:
 
         assert game.is_final is True
 
+    def test_game_state_is_immutable(self):
+        """GameState should be frozen so its cached margin can't go stale."""
+        game = GameState(
+            event_id="test",
+            sport="nfl",
+            home_team=Team(id="1", abbreviation="BUF", display_name="Bills"),
+            away_team=Team(id="2", abbreviation="KC", display_name="Chiefs"),
+            home_score=28,
+            away_score=21,
+            period=4,
+            clock_seconds=0,
+            status=GameStatus.IN,
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            game.home_score = 35  # type: ignore[misc]
+        assert game.margin == 7
+
 
 class TestESPNErrorHandling:
     """Tests for error handling."""
 
     @pytest.mark.asyncio
-    async def test_handles_empty_response(self, espn_client: ESPNClient):
+    async def test_handles_empty_response(
+        self, espn_client: ESPNClient, espn_api: respx.MockRouter
+    ):
         """Should gracefully handle empty events list."""
-        with patch.object(
-            espn_client, "_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = {"events": []}
+        espn_api.get("/football/nfl/scoreboard").respond(json={"events": []})
 
-            async with espn_client:
-                games = await espn_client.get_scoreboard(Sport.NFL)
+        async with espn_client:
+            games = await espn_client.get_scoreboard(Sport.NFL)
 
-            assert games == []
+        assert games == []
 
     @pytest.mark.asyncio
-    async def test_handles_malformed_event(self, espn_client: ESPNClient):
+    async def test_handles_malformed_event(
+        self, espn_client: ESPNClient, espn_api: respx.MockRouter
+    ):
         """Should skip malformed events without crashing."""
-        with patch.object(
-            espn_client, "_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = {
+        espn_api.get("/football/nfl/scoreboard").respond(
+            json={
                 "events": [
                     {"id": "bad", "competitions": []},  # No competitors
                 ]
             }
+        )
 
-            async with espn_client:
-                games = await espn_client.get_scoreboard(Sport.NFL)
+        async with espn_client:
+            games = await espn_client.get_scoreboard(Sport.NFL)
 
-            assert games == []  # Malformed event skipped
+        assert games == []  # Malformed event skipped
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises_espn_error(
+        self, espn_client: ESPNClient, espn_api: respx.MockRouter
+    ):
+        """Should wrap HTTP error statuses in ESPNError."""
+        espn_api.get("/football/nfl/scoreboard").respond(503, text="Unavailable")
+
+        async with espn_client:
+            with pytest.raises(ESPNError, match="503"):
+                await espn_client.get_scoreboard(Sport.NFL)
 
     @pytest.mark.asyncio
     async def test_get_live_games_filters_correctly(
-        self, espn_client: ESPNClient, sample_espn_scoreboard: dict
+        self,
+        espn_client: ESPNClient,
+        espn_api: respx.MockRouter,
+        api_response: Callable[..., httpx.Response],
+        sample_espn_scoreboard: dict,
     ):
         """get_live_games should only return in-progress games."""
-        with patch.object(
-            espn_client, "_request", new_callable=AsyncMock
-        ) as mock_request:
-            mock_request.return_value = sample_espn_scoreboard
+        espn_api.get("/football/nfl/scoreboard").mock(
+            return_value=api_response(sample_espn_scoreboard)
+        )
 
-            async with espn_client:
-                live_games = await espn_client.get_live_games(Sport.NFL)
+        async with espn_client:
+            live_games = await espn_client.get_live_games(Sport.NFL)
 
-            # Sample game is in progress
-            assert len(live_games) == 1
-            assert live_games[0].is_live
+        # Sample game is in progress
+        assert len(live_games) == 1
+        assert live_games[0].is_live
@@ -1,14 +1,50 @@
 """Unit tests for monitoring and logging."""
 
 import json
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, fields
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
-
-from kalshi_trading.monitoring import PerformanceTracker, TradeLogEntry, TradeLogger
+import structlog.testing
+
+from kalshi_trading.monitoring import (
+    PerformanceTracker,
+    TradeLogEntry,
+    TradeLogger,
+    TradeLogRow,
+)
+from kalshi_trading.monitoring import logger as logger_module
 from kalshi_trading.strategies.base import Signal, TradeSignal
 
+# Wall clock seen by TradeLogger in these tests
+FROZEN_NOW = datetime(2026, 1, 8, 16, 0, 0)
+
+
+class _FrozenDateTime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):  # type: ignore[override]
+        return FROZEN_NOW
+
+
+@pytest.fixture(autouse=True)
+def _frozen_now(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pin the logger's clock so day files don't depend on when tests run."""
+    monkeypatch.setattr(logger_module, "datetime", _FrozenDateTime)
+    monkeypatch.setattr(logger_module, "time", SimpleNamespace(time=FROZEN_NOW.timestamp))
+
+
+@pytest.fixture
+def today() -> str:
+    """Date of FROZEN_NOW, as used in log file names."""
+    return "2026-01-08"
+
 
 @pytest.fixture
 def log_dir(tmp_path: Path) -> Path:
@@ -17,9 +53,31 @@ def log_dir(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def trade_logger(log_dir: Path) -> TradeLogger:
+def trade_logger(log_dir: Path) -> Iterator[TradeLogger]:
     """Create trade logger for testing."""
-    return TradeLogger(log_dir)
+    trade_logger = TradeLogger(log_dir)
+    yield trade_logger
+    trade_logger.close()
+
+
+@pytest.fixture
+def background_logger(log_dir: Path) -> Iterator[TradeLogger]:
+    """Create trade logger that writes on a background thread."""
+    trade_logger = TradeLogger(log_dir, background=True)
+    yield trade_logger
+    trade_logger.close()
+
+
+@pytest.fixture
+def log_lines() -> list[bytes]:
+    """Collect JSONL lines written by memory_logger."""
+    return []
+
+
+@pytest.fixture
+def memory_logger(log_dir: Path, log_lines: list[bytes]) -> TradeLogger:
+    """Create a trade logger that writes inline to log_lines, not to disk."""
+    return TradeLogger(log_dir, background=False, sink=log_lines.append)
 
 
 @pytest.fixture
@@ -62,6 +120,31 @@ class TestTradeLogEntry:
         assert entry.status == "executed"
         assert entry.pnl == 100
 
+    def test_to_dict_matches_asdict(self):
+        """to_dict should carry every field, like dataclasses.asdict."""
+        entry = TradeLogEntry(
+            timestamp="2026-01-08T16:00:00",
+            event_id="12345",
+            sport="nfl",
+            matchup="KC@BUF",
+            ticker="NFL-2426-BUF",
+            signal="buy",
+            side="yes",
+            size=10,
+            price=None,
+            fill_price=None,
+            status="rejected",
+            reason="Position limit exceeded",
+            strategy_name="nfl_spread",
+            risk_check=False,
+        )
+
+        assert entry.to_dict() == asdict(entry)
+
+    def test_row_fields_match_entry(self):
+        """TradeLogRow should declare the same fields, in order, as TradeLogEntry."""
+        assert TradeLogRow._fields == tuple(f.name for f in fields(TradeLogEntry))
+
 
 class TestTradeLogger:
     """Tests for TradeLogger."""
@@ -75,7 +158,7 @@ class TestTradeLogger:
         assert log_dir.exists()
 
     def test_log_signal_writes_to_file(
-        self, trade_logger: TradeLogger, sample_signal: TradeSignal, log_dir: Path
+        self, trade_logger: TradeLogger, sample_signal: TradeSignal, log_dir: Path, today: str
     ):
         """Should write signal to log file."""
         trade_logger.log_signal(
@@ -88,8 +171,8 @@ class TestTradeLogger:
             fill_price=65,
         )
 
-        # Check log file exists
-        today = datetime.now().strftime("%Y-%m-%d")
+        # Check log file exists once buffered entries are flushed
+        trade_logger.flush()
         log_file = log_dir / f"trades_{today}.jsonl"
 
         assert log_file.exists()
@@ -101,57 +184,329 @@ class TestTradeLogger:
 
         assert data["ticker"] == "NFL-2426-BUF"
         assert data["status"] == "executed"
+        assert data["timestamp"] == FROZEN_NOW.isoformat()
+
+    @pytest.mark.parametrize(
+        ("outcome", "status", "reason"),
+        [
+            ({"executed": True, "fill_price": 65}, "executed", "Margin exceeded threshold"),
+            ({"dry_run": True}, "dry_run", "Margin exceeded threshold"),
+            (
+                {"executed": False, "rejected_reason": "Position limit exceeded"},
+                "rejected",
+                "Position limit exceeded",
+            ),
+        ],
+        ids=["executed", "dry_run", "rejected"],
+    )
+    def test_log_signal_status(
+        self,
+        memory_logger: TradeLogger,
+        sample_signal: TradeSignal,
+        log_lines: list[bytes],
+        outcome: dict,
+        status: str,
+        reason: str,
+    ):
+        """Should record the outcome's status, and a rejection's reason."""
+        memory_logger.log_signal(
+            signal=sample_signal,
+            event_id="12345",
+            sport="nfl",
+            matchup="KC@BUF",
+            strategy_name="nfl_spread",
+            **outcome,
+        )
 
-    def test_log_dry_run(
-        self, trade_logger: TradeLogger, sample_signal: TradeSignal, log_dir: Path
+        data = json.loads(log_lines[0])
+
+        assert data["status"] == status
+        assert data["reason"] == reason
+        assert data["risk_check"] is (status != "rejected")
+
+    def test_sink_replaces_log_file(
+        self, memory_logger: TradeLogger, sample_signal: TradeSignal, log_lines: list[bytes]
+    ):
+        """Entries sent to a sink should not touch the day file."""
+        memory_logger.log_signal(
+            signal=sample_signal,
+            event_id="12345",
+            sport="nfl",
+            matchup="KC@BUF",
+            strategy_name="nfl_spread",
+            executed=True,
+        )
+        memory_logger.close()
+
+        assert len(log_lines) == 1
+        assert log_lines[0].endswith(b"\n")
+        assert not memory_logger._get_log_file().exists()
+
+    def test_log_file_cached_until_rollover(
+        self, trade_logger: TradeLogger, log_dir: Path, today: str
     ):
-        """Should mark dry run signals."""
+        """Should reuse the day's log file until the next local midnight."""
+
+        first = trade_logger._get_log_file()
+        assert first == log_dir / f"trades_{today}.jsonl"
+
+        trade_logger._current_date = "stale"
+        assert trade_logger._get_log_file() is first
+
+        trade_logger._next_rollover = 0.0
+        trade_logger._get_log_file()
+        assert trade_logger._current_date == today
+
+    def test_get_trades_for_date(
+        self, trade_logger: TradeLogger, sample_signal: TradeSignal, today: str
+    ):
+        """Should retrieve trades for a specific date."""
+        # Log some trades
+        logged = trade_logger.log_signals(
+            {
+                "signal": sample_signal,
+                "event_id": "12345",
+                "sport": "nfl",
+                "matchup": "KC@BUF",
+                "strategy_name": "nfl_spread",
+                "executed": True,
+            }
+            for _ in range(3)
+        )
+        assert logged == 3
+
+        trades = trade_logger.get_trades_for_date(today)
+
+        assert len(trades) == 3
+
+    def test_log_signals_writes_batch_inline(
+        self, log_dir: Path, sample_signal: TradeSignal
+    ):
+        """log_signals should write every entry in one pass, in order."""
+        trade_logger = TradeLogger(log_dir, background=False)
+
+        logged = trade_logger.log_signals(
+            {
+                "signal": sample_signal,
+                "event_id": str(i),
+                "sport": "nfl",
+                "matchup": "KC@BUF",
+                "strategy_name": "nfl_spread",
+                "executed": True,
+            }
+            for i in range(4)
+        )
+        trade_logger.close()
+
+        lines = trade_logger._get_log_file().read_text().splitlines()
+        assert logged == 4
+        assert [json.loads(line)["event_id"] for line in lines] == ["0", "1", "2", "3"]
+        assert trade_logger.log_signals([]) == 0
+
+    def test_buffers_until_flush_every(
+        self, log_dir: Path, sample_signal: TradeSignal
+    ):
+        """Should hold entries in the write buffer until flush_every is reached."""
+        trade_logger = TradeLogger(log_dir, flush_every=2, background=False)
+        log_file = trade_logger._get_log_file()
+
+        for expected_lines in (0, 2):
+            trade_logger.log_signal(
+                signal=sample_signal,
+                event_id="12345",
+                sport="nfl",
+                matchup="KC@BUF",
+                strategy_name="nfl_spread",
+                executed=True,
+            )
+            size = log_file.stat().st_size if log_file.exists() else 0
+            assert (size > 0) == (expected_lines > 0)
+
+        assert len(log_file.read_text().splitlines()) == 2
+        trade_logger.close()
+
+    def test_writes_inline_by_default(
+        self, trade_logger: TradeLogger, sample_signal: TradeSignal
+    ):
+        """Should write on the caller's thread unless background is requested."""
         trade_logger.log_signal(
             signal=sample_signal,
             event_id="12345",
             sport="nfl",
             matchup="KC@BUF",
             strategy_name="nfl_spread",
-            dry_run=True,
+            executed=True,
         )
 
-        today = datetime.now().strftime("%Y-%m-%d")
-        log_file = log_dir / f"trades_{today}.jsonl"
+        assert trade_logger._writer is None
+        assert trade_logger._pending == 1
 
-        with open(log_file) as f:
-            data = json.loads(f.readline())
+    def test_background_writer_drains_on_close(
+        self, background_logger: TradeLogger, sample_signal: TradeSignal
+    ):
+        """Should write queued entries and stop the writer thread on close."""
+        for _ in range(5):
+            background_logger.log_signal(
+                signal=sample_signal,
+                event_id="12345",
+                sport="nfl",
+                matchup="KC@BUF",
+                strategy_name="nfl_spread",
+                executed=True,
+            )
+
+        writer = background_logger._writer
+        background_logger.close()
+
+        assert writer is not None and not writer.is_alive()
+        assert len(background_logger._get_log_file().read_text().splitlines()) == 5
+
+    def test_concurrent_writes_start_one_writer(
+        self,
+        background_logger: TradeLogger,
+        sample_signal: TradeSignal,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Callers racing on the first background write should share one writer thread."""
+        started: list[threading.Thread] = []
+
+        class SlowStartThread(threading.Thread):
+            """Widens the window between the writer check and its start."""
 
-        assert data["status"] == "dry_run"
+            def start(self) -> None:
+                time.sleep(0.01)
+                started.append(self)
+                super().start()
 
-    def test_log_rejected(
+        monkeypatch.setattr(logger_module, "threading", SimpleNamespace(Thread=SlowStartThread))
+        barrier = threading.Barrier(4)
+
+        def log_one() -> None:
+            barrier.wait()
+            background_logger.log_signal(
+                signal=sample_signal,
+                event_id="12345",
+                sport="nfl",
+                matchup="KC@BUF",
+                strategy_name="nfl_spread",
+                executed=True,
+            )
+
+        callers = [threading.Thread(target=log_one) for _ in range(4)]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+        background_logger.close()
+
+        assert len(started) == 1
+        assert len(background_logger._get_log_file().read_text().splitlines()) == 4
+
+    def test_background_write_errors_are_logged_not_raised(
+        self, log_dir: Path, sample_signal: TradeSignal
+    ):
+        """A failed background write should be reported in the log, not to the caller."""
+
+        def broken_sink(line: bytes) -> None:
+            raise OSError("disk full")
+
+        trade_logger = TradeLogger(log_dir, background=True, sink=broken_sink)
+        try:
+            with structlog.testing.capture_logs() as captured:
+                trade_logger.log_signal(
+                    signal=sample_signal,
+                    event_id="12345",
+                    sport="nfl",
+                    matchup="KC@BUF",
+                    strategy_name="nfl_spread",
+                    executed=True,
+                )
+                trade_logger.flush()
+        finally:
+            trade_logger.close()
+
+        errors = [e for e in captured if e["log_level"] == "error"]
+        assert [e["event"] for e in errors] == ["Failed to write trade log entries"]
+        assert errors[0]["error"] == "disk full"
+
+    def test_get_trades_handles_empty_file_and_blank_lines(
         self, trade_logger: TradeLogger, sample_signal: TradeSignal, log_dir: Path
     ):
-        """Should mark rejected signals with reason."""
+        """Should tolerate an empty day file and skip blank lines."""
+        (log_dir / "trades_2020-01-02.jsonl").write_bytes(b"")
+        assert trade_logger.get_trades_for_date("2020-01-02") == []
+
         trade_logger.log_signal(
             signal=sample_signal,
             event_id="12345",
             sport="nfl",
             matchup="KC@BUF",
             strategy_name="nfl_spread",
-            executed=False,
-            rejected_reason="Position limit exceeded",
+            executed=True,
         )
+        trade_logger.close()
+        log_file = trade_logger._get_log_file()
+        log_file.write_bytes(log_file.read_bytes() + b"\n\n")
 
-        today = datetime.now().strftime("%Y-%m-%d")
-        log_file = log_dir / f"trades_{today}.jsonl"
+        trades = trade_logger.get_trades_for_date(trade_logger._current_date)
 
-        with open(log_file) as f:
-            data = json.loads(f.readline())
+        assert len(trades) == 1
+        assert trades[0].ticker == "NFL-2426-BUF"
 
-        assert data["status"] == "rejected"
-        assert data["reason"] == "Position limit exceeded"
+    def test_get_trades_skips_truncated_line(
+        self, trade_logger: TradeLogger, sample_signal: TradeSignal, today: str
+    ):
+        """A partially written trailing line should not hide the rest of the day."""
+        trade_logger.log_signal(
+            signal=sample_signal,
+            event_id="12345",
+            sport="nfl",
+            matchup="KC@BUF",
+            strategy_name="nfl_spread",
+            executed=True,
+        )
+        trade_logger.close()
+        log_file = trade_logger._get_log_file()
+        log_file.write_bytes(log_file.read_bytes() + b'{"timestamp": "2026-01-08T16:')
 
-    def test_get_trades_for_date(
-        self, trade_logger: TradeLogger, sample_signal: TradeSignal
+        trades = trade_logger.get_trades_for_date(today)
+
+        assert len(trades) == 1
+        assert trades[0].ticker == "NFL-2426-BUF"
+
+    def test_get_trades_fills_defaults_for_missing_fields(
+        self, trade_logger: TradeLogger, log_dir: Path
     ):
-        """Should retrieve trades for a specific date."""
-        # Log some trades
-        for _ in range(3):
+        """Should load older lines that lack defaulted fields such as pnl."""
+        line = {
+            "timestamp": "2020-01-03T12:00:00",
+            "event_id": "12345",
+            "sport": "nfl",
+            "matchup": "KC@BUF",
+            "ticker": "NFL-2426-BUF",
+            "signal": "buy",
+            "side": "yes",
+            "size": 10,
+            "price": 64,
+            "fill_price": 64,
+            "status": "executed",
+            "reason": "Hand-written entry",
+            "strategy_name": "nfl_spread",
+            "risk_check": True,
+        }
+        (log_dir / "trades_2020-01-03.jsonl").write_text(json.dumps(line) + "\n")
+
+        trades = trade_logger.get_trades_for_date("2020-01-03")
+        rows = trade_logger.get_trade_rows_for_date("2020-01-03")
+
+        assert trades[0].pnl == 0
+        assert rows[0].pnl == 0
+
+    def test_get_trade_rows_match_entries(
+        self, trade_logger: TradeLogger, sample_signal: TradeSignal, today: str
+    ):
+        """Row tuples should carry the same fields as the dataclass entries."""
+        for pnl in (100, -50):
             trade_logger.log_signal(
                 signal=sample_signal,
                 event_id="12345",
@@ -159,12 +514,36 @@ class TestTradeLogger:
                 matchup="KC@BUF",
                 strategy_name="nfl_spread",
                 executed=True,
+                pnl=pnl,
             )
 
-        today = datetime.now().strftime("%Y-%m-%d")
-        trades = trade_logger.get_trades_for_date(today)
+        rows = trade_logger.get_trade_rows_for_date(today)
+        entries = trade_logger.get_trades_for_date(today)
 
-        assert len(trades) == 3
+        assert all(isinstance(row, TradeLogRow) for row in rows)
+        assert [row._asdict() for row in rows] == [asdict(entry) for entry in entries]
+        assert [row.pnl for row in rows] == [100, -50]
+
+    def test_parsed_day_cached_until_file_changes(
+        self, trade_logger: TradeLogger, sample_signal: TradeSignal, today: str
+    ):
+        """Should reuse a parsed day file until new entries are written to it."""
+        signal_kwargs = {
+            "signal": sample_signal,
+            "event_id": "12345",
+            "sport": "nfl",
+            "matchup": "KC@BUF",
+            "strategy_name": "nfl_spread",
+            "executed": True,
+        }
+        trade_logger.log_signal(**signal_kwargs)
+
+        first = trade_logger._load_day(today)
+        assert trade_logger._load_day(today) is first
+
+        trade_logger.log_signal(**signal_kwargs)
+
+        assert len(trade_logger.get_trades_for_date(today)) == 2
 
     def test_get_trades_returns_empty_for_no_file(self, trade_logger: TradeLogger):
         """Should return empty list if no log file."""
@@ -186,10 +565,61 @@ class TestPerformanceTracker:
         assert summary["total_pnl"] == 0
 
     def test_get_daily_summary_with_trades(
-        self, trade_logger: TradeLogger, sample_signal: TradeSignal
+        self, trade_logger: TradeLogger, sample_signal: TradeSignal, today: str
     ):
         """Should calculate summary for trades."""
         # Log executed trades with P&L
+        trade_logger.log_signals([
+            {
+                "signal": sample_signal,
+                "event_id": "1",
+                "sport": "nfl",
+                "matchup": "KC@BUF",
+                "strategy_name": "nfl_spread",
+                "executed": True,
+                "pnl": 100,
+            },
+            {
+                "signal": sample_signal,
+                "event_id": "2",
+                "sport": "nba",
+                "matchup": "LAL@BOS",
+                "strategy_name": "nba_margin",
+                "executed": True,
+                "pnl": -50,
+            },
+            {
+                "signal": sample_signal,
+                "event_id": "3",
+                "sport": "nfl",
+                "matchup": "DEN@LAS",
+                "strategy_name": "nfl_spread",
+                "dry_run": True,
+            },
+        ])
+
+        tracker = PerformanceTracker(trade_logger)
+        summary = tracker.get_daily_summary(today)
+
+        assert summary["total_trades"] == 3
+        assert summary["executed"] == 2
+        assert summary["dry_runs"] == 1
+        assert summary["total_pnl"] == 50  # 100 - 50
+        assert summary["by_sport"]["nfl"] == 2
+        assert summary["by_sport"]["nba"] == 1
+        assert summary["by_strategy"] == {"nfl_spread": 2, "nba_margin": 1}
+        assert summary["winning_trades"] == 1
+        assert summary["losing_trades"] == 1
+        assert summary["win_rate"] == 0.5
+
+    def test_get_period_summary_spans_days(
+        self,
+        trade_logger: TradeLogger,
+        sample_signal: TradeSignal,
+        log_dir: Path,
+        today: str,
+    ):
+        """Should aggregate trades across every day in the range."""
         trade_logger.log_signal(
             signal=sample_signal,
             event_id="1",
@@ -199,31 +629,35 @@ class TestPerformanceTracker:
             executed=True,
             pnl=100,
         )
-        trade_logger.log_signal(
-            signal=sample_signal,
-            event_id="2",
-            sport="nba",
-            matchup="LAL@BOS",
-            strategy_name="nba_margin",
-            executed=True,
-            pnl=-50,
-        )
-        trade_logger.log_signal(
-            signal=sample_signal,
-            event_id="3",
-            sport="nfl",
-            matchup="DEN@LAS",
-            strategy_name="nfl_spread",
-            dry_run=True,
+        trade_logger.flush()
+
+        yesterday = "2026-01-07"
+        (log_dir / f"trades_{yesterday}.jsonl").write_text(
+            json.dumps(
+                {
+                    "timestamp": f"{yesterday}T12:00:00",
+                    "event_id": "2",
+                    "sport": "nba",
+                    "matchup": "LAL@BOS",
+                    "ticker": "NBA-1",
+                    "signal": "buy",
+                    "side": "yes",
+                    "size": 5,
+                    "price": 50,
+                    "fill_price": None,
+                    "status": "dry_run",
+                    "reason": "test",
+                    "strategy_name": "nba_margin",
+                    "risk_check": True,
+                    "pnl": 0,
+                }
+            )
+            + "\n"
         )
 
         tracker = PerformanceTracker(trade_logger)
-        today = datetime.now().strftime("%Y-%m-%d")
-        summary = tracker.get_daily_summary(today)
+        summary = tracker.get_period_summary(yesterday, today)
 
-        assert summary["total_trades"] == 3
-        assert summary["executed"] == 2
-        assert summary["dry_runs"] == 1
-        assert summary["total_pnl"] == 50  # 100 - 50
-        assert summary["by_sport"]["nfl"] == 2
-        assert summary["by_sport"]["nba"] == 1
+        assert summary["total_trades"] == 2
+        assert summary["executed"] == 1
+        assert summary["total_pnl"] == 100
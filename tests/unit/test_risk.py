@@ -1,40 +1,24 @@
 """Unit tests for risk management."""
 
+import random
+from collections import Counter
+from dataclasses import replace
+
 import pytest
-from datetime import datetime
 
 from kalshi_trading.engine.risk import (
     RiskLimits,
     RiskManager,
     RiskState,
-    TradeRecord,
 )
 from kalshi_trading.strategies.base import Signal, TradeSignal
 
+# Pure in-memory tests; kept on one worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group("unit-fast")
 
-@pytest.fixture
-def risk_manager() -> RiskManager:
-    """Create a risk manager with default limits."""
-    limits = RiskLimits(
-        max_position_size=100,
-        max_daily_loss=50000,  # $500
-        max_exposure_per_market=20000,  # $200
-        max_total_exposure=100000,  # $1000
-    )
-    return RiskManager(limits)
-
-
-@pytest.fixture
-def buy_signal() -> TradeSignal:
-    """Create a sample buy signal."""
-    return TradeSignal(
-        signal=Signal.BUY,
-        ticker="NFL-2426-BUF",
-        side="yes",
-        size=10,
-        price=64,  # 64 cents
-        reason="Test signal",
-    )
+
+# Keys every risk summary must carry
+SUMMARY_KEYS = frozenset({"positions", "total_exposure", "daily_pnl", "trades_today"})
 
 
 class TestRiskLimits:
@@ -81,47 +65,37 @@ class TestRiskState:
         assert state.total_exposure == 8000
 
 
-class TestRiskManagerCanTrade:
-    """Tests for can_trade() checks."""
-
-    def test_allows_valid_trade(self, risk_manager: RiskManager, buy_signal: TradeSignal):
-        """Should allow trade within limits."""
-        assert risk_manager.can_trade(buy_signal) is True
-
-    def test_blocks_exceeds_position_limit(self, risk_manager: RiskManager):
-        """Should block trade exceeding position limit."""
-        large_signal = TradeSignal(
-            signal=Signal.BUY,
-            ticker="NFL-2426-BUF",
-            side="yes",
-            size=150,  # Over 100 limit
-            price=64,
-        )
-
-        assert risk_manager.can_trade(large_signal) is False
+# (id, signal overrides, state overrides, expected can_trade result)
+CAN_TRADE_CASES = [
+    ("valid", {}, {}, True),
+    ("over_position_limit", {"size": 150}, {}, False),  # Over 100 limit
+    ("over_market_exposure", {"size": 100, "price": 250}, {}, False),  # 25000 > 20000
+    ("daily_loss_reached", {}, {"daily_pnl": -50000}, False),  # $500 loss
+]
 
-    def test_blocks_exceeds_market_exposure(self, risk_manager: RiskManager):
-        """Should block trade exceeding market exposure."""
-        # 100 contracts at 64 cents = 6400 cents = $64, should pass
-        # But if price is high enough to exceed $200 exposure, should fail
-        expensive_signal = TradeSignal(
-            signal=Signal.BUY,
-            ticker="NFL-2426-BUF",
-            side="yes",
-            size=100,
-            price=250,  # 100 * 250 = 25000 > 20000 limit
-        )
 
-        assert risk_manager.can_trade(expensive_signal) is False
+class TestRiskManagerCanTrade:
+    """Tests for can_trade() checks."""
 
-    def test_blocks_when_daily_loss_reached(
-        self, risk_manager: RiskManager, buy_signal: TradeSignal
+    @pytest.mark.parametrize(
+        ("signal_overrides", "state_overrides", "expected"),
+        [case[1:] for case in CAN_TRADE_CASES],
+        ids=[case[0] for case in CAN_TRADE_CASES],
+    )
+    def test_can_trade(
+        self,
+        risk_manager: RiskManager,
+        buy_signal: TradeSignal,
+        signal_overrides: dict,
+        state_overrides: dict,
+        expected: bool,
     ):
-        """Should block trades when daily loss limit reached."""
-        # Simulate a big loss
-        risk_manager.state.daily_pnl = -50000  # $500 loss
+        """Should allow trades within limits and block any that break one."""
+        signal = replace(buy_signal, **signal_overrides)
+        for name, value in state_overrides.items():
+            setattr(risk_manager.state, name, value)
 
-        assert risk_manager.can_trade(buy_signal) is False
+        assert risk_manager.can_trade(signal) is expected
 
 
 class TestRiskManagerAdjustSignal:
@@ -155,31 +129,48 @@ class TestRiskManagerAdjustSignal:
 class TestRiskManagerRecordTrade:
     """Tests for record_trade() tracking."""
 
-    def test_records_trade(self, risk_manager: RiskManager, buy_signal: TradeSignal):
-        """Should record trade in state."""
-        risk_manager.record_trade(buy_signal, fill_price=64)
-
-        assert len(risk_manager.state.trades) == 1
-        assert risk_manager.state.trades[0].ticker == "NFL-2426-BUF"
-
-    def test_updates_position(self, risk_manager: RiskManager, buy_signal: TradeSignal):
-        """Should update position after trade."""
-        risk_manager.record_trade(buy_signal, fill_price=64)
-
-        assert risk_manager.state.positions["NFL-2426-BUF"] == 10
-
-    def test_updates_exposure(self, risk_manager: RiskManager, buy_signal: TradeSignal):
-        """Should update exposure after trade."""
-        risk_manager.record_trade(buy_signal, fill_price=64)
-
-        # 10 contracts * 64 cents = 640 cents
-        assert risk_manager.state.exposure["NFL-2426-BUF"] == 640
-
-    def test_updates_daily_pnl(self, risk_manager: RiskManager, buy_signal: TradeSignal):
-        """Should update daily P&L after trade."""
+    def test_record_trade_updates_all_fields(
+        self, risk_manager: RiskManager, buy_signal: TradeSignal
+    ):
+        """Should record the trade and update position, exposure and daily P&L."""
         risk_manager.record_trade(buy_signal, fill_price=64, realized_pnl=-100)
+        state = risk_manager.state
 
-        assert risk_manager.state.daily_pnl == -100
+        assert len(state.trades) == 1
+        assert state.trades[0].ticker == "NFL-2426-BUF"
+        assert state.trades[0].pnl == -100
+        assert state.positions["NFL-2426-BUF"] == 10
+        # 10 contracts * 64 cents = 640 cents
+        assert state.exposure["NFL-2426-BUF"] == 640
+        assert state.daily_pnl == -100
+
+    @pytest.mark.parametrize("n_trades", [10, 100, 1000])
+    def test_record_trade_scales(self, risk_manager: RiskManager, n_trades: int):
+        """Should stay exact over many trades spread across many tickers."""
+        rng = random.Random(0)
+        positions: Counter[str] = Counter()
+        exposure: Counter[str] = Counter()
+
+        for i in range(n_trades):
+            ticker = f"T{i % 50}"
+            size = rng.randint(1, 9)
+            fill_price = rng.randint(1, 99)
+            signal = TradeSignal(
+                signal=Signal.BUY,
+                ticker=ticker,
+                side="yes",
+                size=size,
+                price=fill_price,
+            )
+            risk_manager.record_trade(signal, fill_price=fill_price)
+            positions[ticker] += size
+            exposure[ticker] += size * fill_price
+
+        state = risk_manager.state
+        assert len(state.trades) == n_trades
+        assert state.positions == positions
+        assert state.exposure == exposure
+        assert state.total_exposure == sum(exposure.values())
 
 
 class TestRiskManagerMaxAllowedSize:
@@ -209,7 +200,5 @@ class TestRiskManagerSummary:
 
         summary = risk_manager.get_risk_summary()
 
-        assert "positions" in summary
-        assert "total_exposure" in summary
-        assert "daily_pnl" in summary
+        assert summary.keys() >= SUMMARY_KEYS
         assert summary["trades_today"] == 1
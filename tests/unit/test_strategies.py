@@ -1,11 +1,14 @@
 """Unit tests for trading strategies."""
 
+import functools
+import io
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from kalshi_trading.clients.espn import GameState, GameStatus, Team
-from kalshi_trading.clients.models import Market, MarketStatus, Position
+from kalshi_trading.clients.models import MarketStatus, Position
 from kalshi_trading.config import (
     ConfigError,
     create_strategy_from_config,
@@ -23,51 +26,24 @@ from kalshi_trading.strategies import (
 )
 
 
-# -- Fixtures --
+# Pure in-memory tests; kept on one worker under --dist=loadgroup
+pytestmark = pytest.mark.xdist_group("unit-fast")
 
 
-@pytest.fixture
-def home_team() -> Team:
-    return Team(id="1", abbreviation="BUF", display_name="Buffalo Bills")
+# -- Fixtures --
+# home_team, away_team, live_game and open_market come from tests/conftest.py.
 
 
-@pytest.fixture
-def away_team() -> Team:
-    return Team(id="2", abbreviation="KC", display_name="Kansas City Chiefs")
+@functools.cache
+def _margin(name: str, **config: Any) -> ScoreMarginStrategy:
+    """Shared ScoreMarginStrategy per (name, config); evaluate() keeps no state."""
+    return ScoreMarginStrategy(name=name, config=config)
 
 
-@pytest.fixture
-def live_game(home_team: Team, away_team: Team) -> GameState:
-    """Game in progress with home team leading."""
-    return GameState(
-        event_id="12345",
-        sport="nfl",
-        home_team=home_team,
-        away_team=away_team,
-        home_score=21,
-        away_score=14,
-        period=4,
-        clock_seconds=300.0,  # 5 minutes left
-        status=GameStatus.IN,
-    )
-
-
-@pytest.fixture
-def open_market() -> MarketState:
-    """Open market for testing."""
-    market = Market(
-        ticker="NFL-2426-BUF",
-        event_ticker="NFL-2426",
-        title="Will the Buffalo Bills win?",
-        status=MarketStatus.OPEN,
-        yes_bid=62,
-        yes_ask=64,
-        no_bid=36,
-        no_ask=38,
-        volume=15420,
-        open_interest=8234,
-    )
-    return MarketState(market=market)
+@functools.cache
+def _game_time(name: str, **config: Any) -> GameTimeStrategy:
+    """Shared GameTimeStrategy per (name, config); evaluate() keeps no state."""
+    return GameTimeStrategy(name=name, config=config)
 
 
 # -- Signal Tests --
@@ -120,10 +96,7 @@ class TestScoreMarginStrategy:
         self, live_game: GameState, open_market: MarketState
     ):
         """Should trigger when margin exceeds threshold."""
-        strategy = ScoreMarginStrategy(
-            name="test",
-            config={"min_margin": 7, "direction": "leading", "size": 10},
-        )
+        strategy = _margin("test", min_margin=7, direction="leading", size=10)
 
         signal = strategy.evaluate(live_game, open_market, None)
 
@@ -135,10 +108,7 @@ class TestScoreMarginStrategy:
         self, live_game: GameState, open_market: MarketState
     ):
         """Should not trigger when margin below threshold."""
-        strategy = ScoreMarginStrategy(
-            name="test",
-            config={"min_margin": 10, "direction": "leading"},  # Need 10, have 7
-        )
+        strategy = _margin("test", min_margin=10, direction="leading")  # Need 10, have 7
 
         signal = strategy.evaluate(live_game, open_market, None)
 
@@ -148,10 +118,7 @@ class TestScoreMarginStrategy:
         self, live_game: GameState, open_market: MarketState
     ):
         """Should only trigger when target team is leading."""
-        strategy = ScoreMarginStrategy(
-            name="test",
-            config={"min_margin": 7, "direction": "leading"},
-        )
+        strategy = _margin("test", min_margin=7, direction="leading")
 
         signal = strategy.evaluate(live_game, open_market, None)
         assert signal is not None  # Home team is leading
@@ -160,14 +127,47 @@ class TestScoreMarginStrategy:
         self, live_game: GameState, open_market: MarketState
     ):
         """Should only trigger when target team is trailing."""
-        strategy = ScoreMarginStrategy(
-            name="test",
-            config={"min_margin": 7, "direction": "trailing"},
-        )
+        strategy = _margin("test", min_margin=7, direction="trailing")
 
         signal = strategy.evaluate(live_game, open_market, None)
         assert signal is None  # Home team is leading, not trailing
 
+    def test_triggers_when_trailing_by_margin(
+        self, home_team: Team, away_team: Team, open_market: MarketState
+    ):
+        """Should trigger when home team trails by at least the margin."""
+        trailing_game = GameState(
+            event_id="12345",
+            sport="nfl",
+            home_team=home_team,
+            away_team=away_team,
+            home_score=14,
+            away_score=21,
+            period=4,
+            clock_seconds=300.0,
+            status=GameStatus.IN,
+        )
+        strategy = _margin("test", min_margin=7, direction="trailing")
+
+        signal = strategy.evaluate(trailing_game, open_market, None)
+
+        assert signal is not None
+        assert signal.reason == "Margin 7 exceeds threshold 7 (trailing)"
+
+    def test_evaluate_batch_flags_triggering_rows(self):
+        """Should flag only live rows whose directed margin meets the threshold."""
+        leading = _margin("lead", min_margin=7)
+        trailing = _margin("trail", min_margin=7, direction="trailing")
+        margins = [7, 6, -7, 10, -10]
+        statuses = ["in", "in", "in", "post", "in"]
+
+        assert leading.evaluate_batch(margins, statuses) == [
+            True, False, False, False, False
+        ]
+        assert trailing.evaluate_batch(margins, statuses) == [
+            False, False, True, False, True
+        ]
+
     def test_no_trigger_when_game_not_live(
         self, home_team: Team, away_team: Team, open_market: MarketState
     ):
@@ -184,10 +184,7 @@ class TestScoreMarginStrategy:
             status=GameStatus.PRE,
         )
 
-        strategy = ScoreMarginStrategy(
-            name="test",
-            config={"min_margin": 7, "direction": "leading"},
-        )
+        strategy = _margin("test", min_margin=7, direction="leading")
 
         signal = strategy.evaluate(pre_game, open_market, None)
         assert signal is None
@@ -206,10 +203,7 @@ class TestGameTimeStrategy:
 
     def test_valid_time_in_target_period(self, live_game: GameState):
         """Should be valid when in correct period."""
-        strategy = GameTimeStrategy(
-            name="test",
-            config={"min_period": 4},
-        )
+        strategy = _game_time("test", min_period=4)
 
         assert strategy.is_time_valid(live_game) is True
 
@@ -229,10 +223,7 @@ class TestGameTimeStrategy:
             status=GameStatus.IN,
         )
 
-        strategy = GameTimeStrategy(
-            name="test",
-            config={"min_period": 4},  # Requires 4th quarter
-        )
+        strategy = _game_time("test", min_period=4)  # Requires 4th quarter
 
         assert strategy.is_time_valid(early_game) is False
 
@@ -250,10 +241,7 @@ class TestGameTimeStrategy:
             status=GameStatus.IN,
         )
 
-        strategy = GameTimeStrategy(
-            name="test",
-            config={"min_period": 4, "max_clock": 300},  # Under 5 minutes
-        )
+        strategy = _game_time("test", min_period=4, max_clock=300)  # Under 5 minutes
 
         assert strategy.is_time_valid(late_game) is True
 
@@ -273,14 +261,8 @@ class TestCompositeStrategy:
         self, live_game: GameState, open_market: MarketState
     ):
         """Should trigger when all conditions met with AND."""
-        margin_strategy = ScoreMarginStrategy(
-            name="margin",
-            config={"min_margin": 7, "direction": "leading", "size": 10},
-        )
-        time_strategy = GameTimeStrategy(
-            name="time",
-            config={"min_period": 4},
-        )
+        margin_strategy = _margin("margin", min_margin=7, direction="leading", size=10)
+        time_strategy = _game_time("time", min_period=4)
 
         composite = CompositeStrategy(
             name="composite",
@@ -308,14 +290,8 @@ class TestCompositeStrategy:
             status=GameStatus.IN,
         )
 
-        margin_strategy = ScoreMarginStrategy(
-            name="margin",
-            config={"min_margin": 7, "direction": "leading"},
-        )
-        time_strategy = GameTimeStrategy(
-            name="time",
-            config={"min_period": 4},  # Requires 4th quarter
-        )
+        margin_strategy = _margin("margin", min_margin=7, direction="leading")
+        time_strategy = _game_time("time", min_period=4)  # Requires 4th quarter
 
         composite = CompositeStrategy(
             name="composite",
@@ -326,6 +302,258 @@ class TestCompositeStrategy:
         signal = composite.evaluate(early_game, open_market, None)
         assert signal is None
 
+    def test_or_operator_stops_at_first_signal(
+        self, live_game: GameState, open_market: MarketState
+    ):
+        """Should skip remaining strategies once one signals with OR."""
+
+        class CountingStrategy(TradingStrategy):
+            calls = 0
+
+            def evaluate(self, game_state, market_state, position):
+                CountingStrategy.calls += 1
+                return None
+
+        margin_strategy = _margin("margin", min_margin=7, direction="leading")
+        composite = CompositeStrategy(
+            name="composite",
+            config={"operator": "or"},
+            strategies=[margin_strategy, CountingStrategy(name="counting")],
+        )
+
+        signal = composite.evaluate(live_game, open_market, None)
+
+        assert signal is not None
+        assert CountingStrategy.calls == 0
+
+    def test_and_operator_checks_time_filter_first(
+        self, home_team: Team, away_team: Team, open_market: MarketState
+    ):
+        """Should reject on a failing time filter before running producers."""
+
+        class CountingStrategy(TradingStrategy):
+            calls = 0
+
+            def evaluate(self, game_state, market_state, position):
+                CountingStrategy.calls += 1
+                return None
+
+        early_game = GameState(
+            event_id="12345",
+            sport="nfl",
+            home_team=home_team,
+            away_team=away_team,
+            home_score=21,
+            away_score=14,
+            period=1,
+            clock_seconds=600,
+            status=GameStatus.IN,
+        )
+
+        composite = CompositeStrategy(name="composite", config={"operator": "and"})
+        composite.add_strategy(CountingStrategy(name="counting"))
+        composite.add_strategy(_game_time("time", min_period=4))
+
+        assert composite.evaluate(early_game, open_market, None) is None
+        assert CountingStrategy.calls == 0
+
+    @pytest.mark.parametrize("operator", ["and", "or"])
+    def test_signal_follows_listed_order_not_cost(
+        self, operator: str, live_game: GameState, open_market: MarketState
+    ):
+        """Should return the earliest-listed signal even when a later one is cheaper."""
+        nested = CompositeStrategy(
+            name="nested",
+            config={"operator": "or"},
+            strategies=[_margin("nested_margin", min_margin=7, size=3)],
+        )
+        leaf = _margin("leaf_margin", min_margin=7, size=20)
+        assert nested.EVAL_COST > leaf.EVAL_COST
+
+        composite = CompositeStrategy(
+            name="composite",
+            config={"operator": operator},
+            strategies=[nested, leaf],
+        )
+
+        signal = composite.evaluate(live_game, open_market, None)
+        assert signal is not None
+        assert signal.size == 3
+
+    def test_custom_filter_via_is_allowed(
+        self, live_game: GameState, open_market: MarketState
+    ):
+        """Any strategy overriding is_allowed() should act as an AND filter."""
+
+        class BlockAll(TradingStrategy):
+            PRODUCES_SIGNALS = False
+
+            def evaluate(self, game_state, market_state, position):
+                return None
+
+            def is_allowed(self, game_state):
+                return False
+
+        margin_strategy = _margin("margin", min_margin=7)
+        composite = CompositeStrategy(
+            name="composite",
+            config={"operator": "and"},
+            strategies=[margin_strategy],
+        )
+        assert composite.evaluate(live_game, open_market, None) is not None
+
+        composite.add_strategy(BlockAll(name="block"))
+        assert composite.evaluate(live_game, open_market, None) is None
+
+    @pytest.mark.parametrize(("operator", "expected_size"), [("and", None), ("or", 20)])
+    def test_producer_is_allowed_consulted(
+        self,
+        operator: str,
+        expected_size: int | None,
+        live_game: GameState,
+        open_market: MarketState,
+    ):
+        """A producer's own is_allowed() should reject under AND and be skipped under OR."""
+
+        class GatedMargin(ScoreMarginStrategy):
+            def is_allowed(self, game_state):
+                return False
+
+        gated = GatedMargin(name="gated", config={"min_margin": 7, "size": 3})
+        composite = CompositeStrategy(
+            name="composite",
+            config={"operator": operator},
+            strategies=[gated, _margin("leaf_margin", min_margin=7, size=20)],
+        )
+
+        signal = composite.evaluate(live_game, open_market, None)
+
+        assert (signal.size if signal else None) == expected_size
+
+    def test_evaluate_batch_combines_producer_masks(self):
+        """Should AND/OR producer masks and give up when OR lacks one."""
+
+        class NoMask(TradingStrategy):
+            def evaluate(self, game_state, market_state, position):
+                return None
+
+        lead7 = _margin("lead7", min_margin=7)
+        lead10 = _margin("lead10", min_margin=10)
+        time_filter = _game_time("time", min_period=4)
+        margins = [7, 10, -10]
+        statuses = ["in", "in", "in"]
+
+        both = CompositeStrategy(
+            name="and", config={"operator": "and"},
+            strategies=[lead7, lead10, time_filter, NoMask(name="nomask")],
+        )
+        either = CompositeStrategy(
+            name="or", config={"operator": "or"}, strategies=[lead7, lead10]
+        )
+        either_unknown = CompositeStrategy(
+            name="or", config={"operator": "or"},
+            strategies=[lead7, NoMask(name="nomask")],
+        )
+
+        assert both.evaluate_batch(margins, statuses) == [False, True, False]
+        assert either.evaluate_batch(margins, statuses) == [True, True, False]
+        assert either_unknown.evaluate_batch(margins, statuses) is None
+
+    @pytest.mark.parametrize(
+        ("operator", "margin_configs"),
+        [
+            ("and", [(3, "leading"), (10, "leading")]),
+            ("or", [(3, "leading"), (7, "trailing"), (10, "leading")]),
+        ],
+    )
+    def test_evaluate_batch_matches_evaluate(
+        self,
+        operator: str,
+        margin_configs: list[tuple[int, str]],
+        home_team: Team,
+        away_team: Team,
+        open_market: MarketState,
+    ):
+        """The batch mask should agree with evaluate() row by row."""
+        composite = CompositeStrategy(
+            name=operator,
+            config={"operator": operator},
+            strategies=[
+                _margin(f"{direction}{min_margin}", min_margin=min_margin, direction=direction)
+                for min_margin, direction in margin_configs
+            ],
+        )
+        rows = [
+            (margin, status)
+            for margin in range(-12, 13)
+            for status in (GameStatus.PRE, GameStatus.IN, GameStatus.POST)
+        ]
+
+        mask = composite.evaluate_batch(
+            [margin for margin, _ in rows], [status.value for _, status in rows]
+        )
+        expected = [
+            composite.evaluate(
+                GameState(
+                    event_id="truth",
+                    sport="nfl",
+                    home_team=home_team,
+                    away_team=away_team,
+                    home_score=20 + max(margin, 0),
+                    away_score=20 - min(margin, 0),
+                    period=4,
+                    clock_seconds=300.0,
+                    status=status,
+                ),
+                open_market,
+                None,
+            )
+            is not None
+            for margin, status in rows
+        ]
+
+        assert mask == expected
+        assert any(mask)
+
+    def test_or_operator_ignores_failing_time_filter(
+        self, live_game: GameState, open_market: MarketState
+    ):
+        """A failing time filter shouldn't block an OR composite's producers."""
+        composite = CompositeStrategy(
+            name="composite",
+            config={"operator": "or"},
+            strategies=[
+                _margin("margin", min_margin=7),
+                _game_time("time", min_period=5),
+            ],
+        )
+
+        assert composite.evaluate(live_game, open_market, None) is not None
+
+    def test_closed_market_skips_sub_strategies(
+        self, live_game: GameState, open_market: MarketState
+    ):
+        """Should reject a closed market once, before any sub-strategy runs."""
+
+        class CountingStrategy(TradingStrategy):
+            calls = 0
+
+            def evaluate(self, game_state, market_state, position):
+                CountingStrategy.calls += 1
+                return None
+
+        closed_market = MarketState(
+            market=open_market.market.model_copy(update={"status": MarketStatus.CLOSED})
+        )
+        composite = CompositeStrategy(
+            name="composite",
+            config={"operator": "or"},
+            strategies=[CountingStrategy(name="counting")],
+        )
+
+        assert composite.evaluate(live_game, closed_market, None) is None
+        assert CountingStrategy.calls == 0
+
 
 # -- Config Loading Tests --
 
@@ -333,10 +561,9 @@ class TestCompositeStrategy:
 class TestStrategyConfiguration:
     """Tests for strategy config loading."""
 
-    def test_load_valid_yaml(self, tmp_path: Path):
+    def test_load_valid_yaml(self):
         """Should load valid YAML configuration."""
-        config_file = tmp_path / "test.yaml"
-        config_file.write_text("""
+        config_file = io.StringIO("""
 name: test_strategy
 enabled: true
 entry_conditions:
@@ -398,3 +625,50 @@ trade:
 
         assert strategy.name == "nfl_spread"
         assert isinstance(strategy, ScoreMarginStrategy)
+
+    def test_disabled_strategy_from_stream_rejected(self):
+        """Should refuse a disabled strategy read from a stream."""
+        config_file = io.StringIO("""
+name: paused
+enabled: false
+type: score_margin
+""")
+
+        with pytest.raises(ConfigError, match="'paused' is disabled"):
+            load_strategy_from_file(config_file)
+
+    @pytest.mark.parametrize("from_path", [True, False])
+    def test_invalid_yaml_raises_config_error(self, tmp_path: Path, from_path: bool):
+        """Should wrap YAML parse errors from files and streams in ConfigError."""
+        text = "name: [unclosed\n"
+        if from_path:
+            source: Path | io.StringIO = tmp_path / "broken.yaml"
+            source.write_text(text)
+        else:
+            source = io.StringIO(text)
+
+        with pytest.raises(ConfigError, match="Invalid YAML") as excinfo:
+            load_yaml_config(source)
+
+        assert excinfo.value.__cause__ is not None
+
+    def test_yaml_boolean_side_normalized(
+        self, live_game: GameState, open_market: MarketState
+    ):
+        """Should treat YAML's boolean `side: no` as the "no" side."""
+        config_file = io.StringIO("""
+name: fade_leader
+entry_conditions:
+  - type: score_margin
+    params:
+      min_margin: 7
+trade:
+  side: no
+""")
+
+        strategy = load_strategy_from_file(config_file)
+        signal = strategy.evaluate(live_game, open_market, None)
+
+        assert signal is not None
+        assert signal.side == "no"
+        assert signal.price == open_market.no_ask + 2